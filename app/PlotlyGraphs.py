@@ -4,16 +4,20 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
-import scipy.stats as stats
 from itertools import groupby
 
 DB_PATH = "health_tracker.db"
 TABLE = "detailed_logs"
+# Line traces are thinned to about this many points so the dashboard HTML stays small on long logs
+MAX_LINE_POINTS = 5000
+# The format main3 logs timestamps in; giving it to to_datetime skips per-value format inference
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 class HealthInsightsVisualizer:
     def __init__(self, db_path=DB_PATH):
         self.db_path = db_path
         self.data = None
+        self._posture_vc = None
     
     def load_and_prepare_data(self):
         try:
@@ -23,47 +27,57 @@ class HealthInsightsVisualizer:
             conn.close()
             
             # Parse timestamp
-            self.data['timestamp'] = pd.to_datetime(self.data['timestamp'])
+            self.data['timestamp'] = pd.to_datetime(self.data['timestamp'], format=TIMESTAMP_FORMAT)
             
-            # Fill missing game names
-            self.data['game'] = self.data['game'].fillna('Unspecified')
+            # Fill missing game names; a category so masks and groupbys work on integer codes
+            self.data['game'] = self.data['game'].fillna('Unspecified').astype('category')
             
             self._engineer_health_features()
+            self._posture_vc = None
             return True
         except Exception as e:
             print(f"Data preparation error: {e}")
             return False
     
     def _engineer_health_features(self):
-        self.data['Hour'] = self.data['timestamp'].dt.hour
-        self.data['Day'] = self.data['timestamp'].dt.day_name()
-        self.data['Date'] = self.data['timestamp'].dt.date
-        
-        # Posture risk scoring
-        def calculate_posture_risk(row):
-            risk = 0
-            if row['good_posture'] == 0:
-                risk += 2
-            if row['forward_lean_flag'] == 1:
-                risk += 1
-            if row['uneven_shoulders_flag'] == 1:
-                risk += 1
-            if row['forward_lean'] and row['forward_lean'] > 0.1:
-                risk += 1
-            if row['back_angle'] and row['back_angle'] < 170:
-                risk += 1
-            return risk
-        
-        self.data['Posture_Risk_Score'] = self.data.apply(calculate_posture_risk, axis=1)
+        ts = self.data['timestamp'].dt
+        self.data['Hour'] = ts.hour.astype(np.int8)
+        self.data['Day'] = ts.day_name()
+        self.data['Date'] = ts.date
+        
+        # Posture risk scoring, vectorized over whole columns instead of a per-row apply.
+        # NULL metrics become NaN and compare False; a 0 back angle means "not measured", as before
+        fl = self.data['forward_lean'].to_numpy(dtype=np.float64)
+        ba = self.data['back_angle'].to_numpy(dtype=np.float64)
+        self.data['Posture_Risk_Score'] = (
+            (self.data['good_posture'].to_numpy() == 0).astype(np.int8) * 2
+            + (self.data['forward_lean_flag'].to_numpy() == 1).astype(np.int8)
+            + (self.data['uneven_shoulders_flag'].to_numpy() == 1).astype(np.int8)
+            + (fl > 0.1).astype(np.int8)
+            + ((ba != 0) & (ba < 170)).astype(np.int8)
+        )
         self.data.sort_values('timestamp', inplace=True)
-        self.data['Cumulative_Forward_Lean'] = self.data['forward_lean'].cumsum()
-        self.data['Cumulative_Posture_Risk'] = self.data['Posture_Risk_Score'].cumsum()
-        self.data['Game_Session'] = (self.data['game'] != self.data['game'].shift()).cumsum()
+        # Plain ndarray running sums (rows are already in sorted order); NULL leans add nothing
+        self.data['Cumulative_Forward_Lean'] = np.nancumsum(self.data['forward_lean'].to_numpy(dtype=np.float64))
+        self.data['Cumulative_Posture_Risk'] = np.cumsum(self.data['Posture_Risk_Score'].to_numpy())
+        # A new session starts wherever the game code changes from the previous row (-2 is never a code)
+        codes = self.data['game'].cat.codes.to_numpy()
+        self.data['Game_Session'] = np.cumsum(np.diff(codes, prepend=-2) != 0)
     
+    def _posture_counts(self):
+        # Counted once and shared by the dashboard pie and both good-posture percentages
+        if self._posture_vc is None:
+            self._posture_vc = self.data['good_posture'].value_counts()
+        return self._posture_vc
+
+    def _good_posture_pct(self):
+        vc = self._posture_counts()
+        return vc.get(1, 0) / vc.sum() * 100
+
     def create_comprehensive_health_dashboard(self):
         # --- Compute Top 3 Insights ---
-        good_pct = self.data['good_posture'].mean() * 100
-        worst_game = self.data.groupby('game')['Posture_Risk_Score'].mean().idxmax()
+        good_pct = self._good_posture_pct()
+        worst_game = self.data.groupby('game', observed=True)['Posture_Risk_Score'].mean().idxmax()
         best_streak = max([sum(1 for _ in g) for k, g in groupby(self.data['good_posture']) if k == 1])
         
         # Create a SIMPLE subplot structure that works
@@ -99,7 +113,7 @@ class HealthInsightsVisualizer:
         }
         
         # 1. Posture Distribution (Pie Chart) - Row 1, Col 1
-        posture_counts = self.data['good_posture'].replace({1: 'Good Posture', 0: 'Poor Posture'}).value_counts()
+        posture_counts = self._posture_counts().rename(index={1: 'Good Posture', 0: 'Poor Posture'})
         fig.add_trace(
             go.Pie(
                 labels=posture_counts.index,
@@ -134,13 +148,17 @@ class HealthInsightsVisualizer:
             row=1, col=2
         )
         
+        # Every step-th row of the time series; rolling means are still computed on the full data
+        step = max(1, len(self.data) // MAX_LINE_POINTS)
+        timestamps = self.data['timestamp'].iloc[::step]
+
         # 3. Forward Lean Over Time (Line Chart) - Row 2, Col 1
         forward_lean_rolling = self.data['forward_lean'].rolling(window=10).mean()
         if forward_lean_rolling.notna().sum() > 0:
             fig.add_trace(
                 go.Scatter(
-                    x=self.data['timestamp'],
-                    y=forward_lean_rolling,
+                    x=timestamps,
+                    y=forward_lean_rolling.iloc[::step],
                     mode='lines+markers',
                     line=dict(color=colors['primary'], width=3),
                     marker=dict(size=5),
@@ -160,11 +178,16 @@ class HealthInsightsVisualizer:
             # )
         
         # 4. Game Box Plots - Row 2, Col 2
-        unique_games = self.data['game'].unique()
+        # Split the frame by game once for the box plots and streaks instead of masking it per game
+        forward_lean_by_game = {}
+        posture_by_game = {}
+        for game, group in self.data.groupby('game', sort=False, observed=True):
+            forward_lean_by_game[game] = group['forward_lean'].to_numpy()
+            posture_by_game[game] = group['good_posture'].to_numpy()
+        unique_games = list(forward_lean_by_game)
         plot_colors = ['#667eea', '#764ba2', '#f093fb', '#f5576c', '#4facfe', '#00f2fe']
         
-        for i, game in enumerate(unique_games):
-            game_data = self.data[self.data['game'] == game]['forward_lean']
+        for i, (game, game_data) in enumerate(forward_lean_by_game.items()):
             fig.add_trace(
                 go.Box(
                     y=game_data,
@@ -181,8 +204,8 @@ class HealthInsightsVisualizer:
         if back_angle_rolling.notna().sum() > 0:
             fig.add_trace(
                 go.Scatter(
-                    x=self.data['timestamp'],
-                    y=back_angle_rolling,
+                    x=timestamps,
+                    y=back_angle_rolling.iloc[::step],
                     mode='lines+markers',
                     line=dict(color=colors['good'], width=3),
                     marker=dict(size=5),
@@ -205,8 +228,8 @@ class HealthInsightsVisualizer:
         shoulder_rolling = self.data['shoulder_alignment'].rolling(window=10).mean()
         fig.add_trace(
             go.Scatter(
-                x=self.data['timestamp'],
-                y=shoulder_rolling,
+                x=timestamps,
+                y=shoulder_rolling.iloc[::step],
                 mode='lines+markers',
                 line=dict(color=colors['secondary'], width=3),
                 marker=dict(size=5),
@@ -237,8 +260,7 @@ class HealthInsightsVisualizer:
         
         # 8. Posture Streaks by Game - Row 4, Col 2
         streaks = []
-        for game in unique_games:
-            game_data = self.data[self.data['game'] == game]['good_posture']
+        for game_data in posture_by_game.values():
             max_streak = 0
             current_streak = 0
             for val in game_data:
@@ -274,23 +296,17 @@ class HealthInsightsVisualizer:
             showlegend=False,
             template='plotly_white',
             font=dict(size=12),
-            margin=dict(t=200, b=60, l=60, r=60)
+            margin=dict(t=200, b=60, l=60, r=60),
+            # Axis labels, set in the same layout update. The pie has no axes, so the heatmap at
+            # row 1 col 2 is axis 1 and the rest follow row by row: 2 = (2,1) ... 7 = (4,2)
+            xaxis2_title_text="Time", yaxis2_title_text="Forward Lean",
+            xaxis3_title_text="Game", yaxis3_title_text="Forward Lean",
+            xaxis4_title_text="Time", yaxis4_title_text="Back Angle (°)",
+            xaxis5_title_text="Time", yaxis5_title_text="Shoulder Alignment",
+            xaxis6_title_text="Hour", yaxis6_title_text="Day",
+            xaxis7_title_text="Game", yaxis7_title_text="Longest Streak",
         )
         
-        # Update axis labels
-        fig.update_xaxes(title_text="Time", row=2, col=1)
-        fig.update_yaxes(title_text="Forward Lean", row=2, col=1)
-        fig.update_xaxes(title_text="Game", row=2, col=2)
-        fig.update_yaxes(title_text="Forward Lean", row=2, col=2)
-        fig.update_xaxes(title_text="Time", row=3, col=1)
-        fig.update_yaxes(title_text="Back Angle (°)", row=3, col=1)
-        fig.update_xaxes(title_text="Time", row=3, col=2)
-        fig.update_yaxes(title_text="Shoulder Alignment", row=3, col=2)
-        fig.update_xaxes(title_text="Hour", row=4, col=1)
-        fig.update_yaxes(title_text="Day", row=4, col=1)
-        fig.update_xaxes(title_text="Game", row=4, col=2)
-        fig.update_yaxes(title_text="Longest Streak", row=4, col=2)
-        
         # Add simple, clear annotations that won't overlap
         fig.add_annotation(
             text="🟢 Green = Good Posture | 🔴 Red = Poor Posture",
@@ -365,20 +381,24 @@ class HealthInsightsVisualizer:
         )
         
         # Save and show
-        fig.write_html("advanced_gaming_health_insights.html")
+        # Load plotly.js from the CDN instead of embedding the ~3 MB bundle in every file
+        fig.write_html("advanced_gaming_health_insights.html", include_plotlyjs='cdn')
         fig.show(auto_open=False)
         
         return fig
     
     def generate_comprehensive_health_report(self):
         # --- User-friendly, actionable report ---
-        good_pct = self.data['good_posture'].mean() * 100
+        good_pct = self._good_posture_pct()
         avg_risk = self.data['Posture_Risk_Score'].mean()
-        worst_game = self.data.groupby('game')['Posture_Risk_Score'].mean().idxmax()
-        best_game = self.data.groupby('game')['Posture_Risk_Score'].mean().idxmin()
+        # One groupby per key, then read both ends off the same means
+        game_risk = self.data.groupby('game', observed=True)['Posture_Risk_Score'].mean()
+        hour_risk = self.data.groupby('Hour')['Posture_Risk_Score'].mean()
+        worst_game = game_risk.idxmax()
+        best_game = game_risk.idxmin()
         best_streak = max([sum(1 for _ in g) for k, g in groupby(self.data['good_posture']) if k == 1])
-        hour_worst = self.data.groupby('Hour')['Posture_Risk_Score'].mean().idxmax()
-        hour_best = self.data.groupby('Hour')['Posture_Risk_Score'].mean().idxmin()
+        hour_worst = hour_risk.idxmax()
+        hour_best = hour_risk.idxmin()
         
         print("\n" + "="*60)
         print("🎮 GAMING HEALTH REPORT 🎮")
@@ -1,13 +1,38 @@
+import contextlib
+import os
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
-import scipy.stats as stats
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier, IsolationForest
 from sklearn.metrics import classification_report, accuracy_score
 import matplotlib.pyplot as plt
+try:
+    import pyarrow  # parquet cache of the engineered frame; optional
+except ImportError:
+    pyarrow = None
+
+# Pin the column types up front instead of letting read_csv infer them row by row
+CSV_DTYPES = {
+    'Back Angle': 'float32',
+    'Forward Lean': 'float32',
+    'Shoulder Alignment': 'float32',
+    'Posture Status': 'category',
+}
+# The format main3 logs timestamps in; giving it to to_datetime skips per-value format inference
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Part of the parquet cache's file name; bump it whenever CSV_DTYPES or _engineer_health_features
+# changes so frames engineered by older code are not served
+CACHE_VERSION = 1
+# Line traces are thinned to about this many points so the dashboard HTML stays small on long logs
+MAX_LINE_POINTS = 5000
+
+def _category_code(column, value):
+    """Integer code of value in a categorical column, or -2 (never a valid code, NaN is -1) if absent"""
+    categories = column.cat.categories
+    return categories.get_loc(value) if value in categories else -2
 
 class HealthInsightsVisualizer:
     def __init__(self, filepath):
@@ -20,14 +45,31 @@ class HealthInsightsVisualizer:
     def load_and_prepare_data(self):
         """Load and comprehensively prepare health tracking data"""
         try:
-            # Load data with enhanced parsing
-            self.data = pd.read_csv(self.filepath, parse_dates=['Timestamp'])
-            
-            # Remove duplicate timestamps
-            self.data.drop_duplicates(subset=['Timestamp'], keep='first', inplace=True)
-            
-            # Create derived features for deeper insights
-            self._engineer_health_features()
+            cache_path = f'{self.filepath}.v{CACHE_VERSION}.parquet'
+            if (pyarrow is not None and os.path.exists(cache_path)
+                    and os.path.getmtime(cache_path) > os.path.getmtime(self.filepath)):
+                # Engineered features from an earlier run on the same CSV
+                self.data = pd.read_parquet(cache_path)
+            else:
+                # Load data with enhanced parsing
+                self.data = pd.read_csv(self.filepath, dtype=CSV_DTYPES)
+                self.data['Timestamp'] = pd.to_datetime(self.data['Timestamp'], format=TIMESTAMP_FORMAT)
+
+                # Remove duplicate timestamps
+                self.data.drop_duplicates(subset=['Timestamp'], keep='first', inplace=True)
+
+                # Create derived features for deeper insights
+                self._engineer_health_features()
+                if pyarrow is not None:
+                    try:
+                        self.data.to_parquet(cache_path)
+                    except (OSError, ValueError, TypeError, NotImplementedError) as e:
+                        # The frame loaded fine; only the next run misses the cache. pyarrow's
+                        # errors for columns it can't store subclass TypeError/NotImplementedError
+                        print(f"Could not cache engineered data: {e}")
+                        # Don't leave a partly written file for the next run to load
+                        with contextlib.suppress(OSError):
+                            os.remove(cache_path)
             
             # Train ML models
             self._train_fatigue_model()
@@ -40,41 +82,39 @@ class HealthInsightsVisualizer:
     
     def _engineer_health_features(self):
         """Create advanced derived features for health insights"""
-        # Time-based features
-        self.data['Hour'] = self.data['Timestamp'].dt.hour
-        self.data['Day'] = self.data['Timestamp'].dt.day_name()
-        self.data['Date'] = self.data['Timestamp'].dt.date
+        # Time-based features, all from one datetime accessor
+        ts = self.data['Timestamp'].dt
+        self.data['Hour'] = ts.hour.astype(np.int8)
+        self.data['Day'] = ts.day_name()
+        self.data['Date'] = ts.date
         
-        # Game categorization
-        self.data['Game'] = self.data['Game'].fillna('Unspecified')
+        # Game categorization; stored as a category so masks and groupbys work on integer codes
+        self.data['Game'] = self.data['Game'].fillna('Unspecified').astype('category')
         
         # Fatigue Level Calculation
         self.data['Fatigue_Level'] = self.data.apply(self._get_fatigue_label, axis=1)
         
-        # Posture risk scoring
-        def calculate_posture_risk(row):
-            risk = 0
-            if row['Posture Status'] == 'Slouching':
-                risk += 3
-            elif row['Posture Status'] == 'Forward Head Posture':
-                risk += 2
-            
-            # Additional risk factors
-            if row['Forward Lean'] > 0.1:  # Significant forward lean
-                risk += 1
-            if row['Back Angle'] < 170:  # Bad back angle
-                risk += 1
-            
-            return risk
-        
-        self.data['Posture_Risk_Score'] = self.data.apply(calculate_posture_risk, axis=1)
+        # Posture risk scoring, vectorized over whole columns instead of a per-row apply
+        ps = self.data['Posture Status'].cat.codes.to_numpy()
+        slouching = _category_code(self.data['Posture Status'], 'Slouching')
+        forward_head = _category_code(self.data['Posture Status'], 'Forward Head Posture')
+        fl = self.data['Forward Lean'].to_numpy()
+        ba = self.data['Back Angle'].to_numpy()
+        self.data['Posture_Risk_Score'] = (
+            (ps == slouching).astype(np.int8) * 3
+            + (ps == forward_head).astype(np.int8) * 2
+            + (fl > 0.1).astype(np.int8)  # Significant forward lean
+            + (ba < 170).astype(np.int8)  # Bad back angle
+        )
         
         # Cumulative metrics
         self.data.sort_values('Timestamp', inplace=True)
         
         # Strain accumulation
-        self.data['Cumulative_Forward_Lean'] = self.data['Forward Lean'].cumsum()
-        self.data['Cumulative_Posture_Risk'] = self.data['Posture_Risk_Score'].cumsum()
+        # Plain ndarray running sums (rows are already in sorted order); a float64 accumulator so
+        # the float32 leans don't lose precision over a long log, and missing leans add nothing
+        self.data['Cumulative_Forward_Lean'] = np.nancumsum(self.data['Forward Lean'].to_numpy(), dtype=np.float64)
+        self.data['Cumulative_Posture_Risk'] = np.cumsum(self.data['Posture_Risk_Score'].to_numpy())
 
     def _get_fatigue_label(self, row):
         """Comprehensive fatigue level mapping"""
@@ -200,11 +240,16 @@ class HealthInsightsVisualizer:
             row=1, col=3
         )
 
+        # Split the frame by game once for both per-game box plots instead of masking it per game
+        forward_lean_by_game = {}
+        fatigue_by_game = {}
+        for game, group in self.data.groupby('Game', sort=False, observed=True):
+            forward_lean_by_game[game] = group['Forward Lean'].to_numpy()
+            fatigue_by_game[game] = group['Fatigue_Level'].to_numpy()
+
         # 4. Forward Lean by Game (Box Plot)
         game_forward_lean = []
-        unique_games = self.data['Game'].unique()
-        for i, game in enumerate(unique_games):
-            game_data = self.data[self.data['Game'] == game]['Forward Lean']
+        for i, (game, game_data) in enumerate(forward_lean_by_game.items()):
             game_forward_lean.append(
                 go.Box(
                     y=game_data,
@@ -248,10 +293,11 @@ class HealthInsightsVisualizer:
 
         # 7. Cumulative Physical Strain (Line Chart)
         strain_rolling = self.data['Cumulative_Forward_Lean'].rolling(window=10).mean()
+        step = max(1, len(self.data) // MAX_LINE_POINTS)
         fig.add_trace(
             go.Scatter(
-                x=self.data['Timestamp'], 
-                y=strain_rolling,
+                x=self.data['Timestamp'].iloc[::step], 
+                y=strain_rolling.iloc[::step],
                 mode='lines',
                 line=dict(color='blue', width=2),
                 name='Cumulative Strain (Rolling Mean)'
@@ -298,8 +344,7 @@ class HealthInsightsVisualizer:
 
         # 11. Fatigue Level Analysis (Box Plot)
         game_fatigue = []
-        for i, game in enumerate(unique_games):
-            game_data = self.data[self.data['Game'] == game]['Fatigue_Level']
+        for i, (game, game_data) in enumerate(fatigue_by_game.items()):
             game_fatigue.append(
                 go.Box(
                     y=game_data,
@@ -337,11 +382,18 @@ class HealthInsightsVisualizer:
         )
 
         # Save and show the dashboard
-        fig.write_html("advanced_gaming_health_insights_ml.html")
+        # Load plotly.js from the CDN instead of embedding the ~3 MB bundle in every file
+        fig.write_html("advanced_gaming_health_insights_ml.html", include_plotlyjs='cdn')
         fig.show()
 
     def generate_comprehensive_health_report(self):
         """Generate an in-depth health analysis report with ML insights"""
+        # One groupby pass for all fatigue levels instead of three boolean masks per level
+        risk_by_level = self.data.groupby('Fatigue_Level')['Posture_Risk_Score']
+        level_counts = risk_by_level.size().reindex([1, 2, 3], fill_value=0)
+        level_risk = risk_by_level.mean().reindex([1, 2, 3])
+        anomalies = self.data['Anomaly'] == -1
+
         ml_insights = {
             "Fatigue Prediction": {
                 "Model Accuracy": accuracy_score(
@@ -354,14 +406,14 @@ class HealthInsightsVisualizer:
                 ))
             },
             "Anomaly Detection": {
-                "Total Anomalies": len(self.data[self.data['Anomaly'] == -1]),
-                "Anomaly Percentage": (self.data['Anomaly'] == -1).mean() * 100
+                "Total Anomalies": int(anomalies.sum()),
+                "Anomaly Percentage": anomalies.mean() * 100
             },
             "Fatigue Level Insights": {
                 level: {
-                    "Count": len(self.data[self.data['Fatigue_Level'] == level]),
-                    "Percentage": (self.data['Fatigue_Level'] == level).mean() * 100,
-                    "Avg Posture Risk": self.data[self.data['Fatigue_Level'] == level]['Posture_Risk_Score'].mean()
+                    "Count": int(level_counts[level]),
+                    "Percentage": level_counts[level] / len(self.data) * 100,
+                    "Avg Posture Risk": level_risk[level]
                 } for level in [1, 2, 3]
             }
         }
@@ -7,5 +7,7 @@ DEFAULT_BREAK_INTERVAL = 30
 # Posture detection parameters
 POSTURE_BUFFER_SIZE = 30
 MOTION_THRESHOLD = 50
+# Mean grey-level change below which a frame counts as unchanged and pose inference is skipped
+STATIC_FRAME_THRESHOLD = 2.0
 
 # Add more configuration values here as needed 
\ No newline at end of file
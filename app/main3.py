@@ -1,8 +1,9 @@
 import sys
 import time
+import functools
+import contextlib
 import threading
 import sqlite3
-import csv
 import random
 from datetime import datetime, timedelta, timezone
 import os
@@ -10,6 +11,7 @@ import psutil
 import subprocess
 import webbrowser
 import pytz
+import numpy as np
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
@@ -17,17 +19,13 @@ from PyQt6.QtWidgets import (
     QLineEdit, QGridLayout, QListWidgetItem
 )
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QThread
-from PyQt6.QtGui import QPixmap, QColor, QPalette
-from plyer import notification
-from win10toast import ToastNotifier
-import matplotlib.pyplot as plt
+from PyQt6.QtGui import QImage, QPixmap, QColor, QPalette
 
 try:
     from app.config import DEFAULT_HYDRATION_INTERVAL, DEFAULT_BREAK_INTERVAL
 except ImportError:
     from config import DEFAULT_HYDRATION_INTERVAL, DEFAULT_BREAK_INTERVAL
 
-from posture_detection import PostureDetector
 
 # Remove old is_game_running and related logic
 # Add foreground app detection
@@ -44,17 +42,25 @@ except ImportError:
     win32process = None
     psutil = None
 
+# Last foreground process seen, so repeated polls of the same window skip the name lookup
+_last_game_pid = None
+_last_game_name = None
+
 def get_foreground_app():
+    global _last_game_pid, _last_game_name
     # Try win32gui/win32process/psutil first for reliable process name
     if win32gui and win32process and psutil:
         hwnd = win32gui.GetForegroundWindow()
         title = win32gui.GetWindowText(hwnd)
         try:
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            proc = psutil.Process(pid)
-            exe = proc.name()
+            if pid == _last_game_pid and psutil.pid_exists(pid):
+                return title, _last_game_name
+            exe = psutil.Process(pid).name()
+            _last_game_pid, _last_game_name = pid, exe
         except Exception:
             exe = None
+            _last_game_pid = _last_game_name = None
         return title, exe
     # Fallback: pygetwindow for window title only
     if gw:
@@ -63,64 +69,196 @@ def get_foreground_app():
             return win.title, None
     return None, None
 
+# HT_DB_PATH overrides the database, e.g. "file:ht_test?mode=memory&cache=shared" for an
+# in-memory database shared by every connection in the process (used by the tests); it lives
+# as long as the log connection setup_database() opens, until close_log_connection()
+DB_PATH = os.environ.get("HT_DB_PATH", "health_tracker.db")
+
+INSERT_LOG_SQL = '''INSERT INTO detailed_logs (timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+
+ADD_POINTS_SQL = "UPDATE user_points SET points = points + ? WHERE id = 1"
+
+# Long-lived connection for log writes; sqlite3 caches the compiled INSERT per connection.
+# Autocommit mode so every write opens its own explicit BEGIN ... COMMIT.
+_log_conn = None
+# Reentrant so log_action can run inside logging_transaction(), which holds it throughout
+_log_lock = threading.RLock()
+# True while logging_transaction() has a transaction open on _log_conn
+_log_batch = False
+
+# Points earned but not yet written; flushed with the next log write (guarded by _log_lock)
+_pending_points = 0
+
+# Per-connection settings for the log writer: one fsync per WAL checkpoint instead of per
+# commit, temp tables in RAM, 20 MB page cache, 256 MB memory-mapped reads
+LOG_CONN_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=268435456;
+'''
+
+def _get_log_conn():
+    global _log_conn
+    if _log_conn is None:
+        _log_conn = sqlite3.connect(DB_PATH, uri=True, check_same_thread=False, isolation_level=None)
+        _log_conn.executescript(LOG_CONN_PRAGMAS)
+    return _log_conn
+
+def _write_logs(conn, *rows):
+    # Caller holds _log_lock; the rows and any pending points share one transaction
+    global _pending_points
+    if _log_batch:
+        # Already inside logging_transaction(); points are written when it commits
+        conn.executemany(INSERT_LOG_SQL, rows)
+        return
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_LOG_SQL, rows)
+        if _pending_points:
+            conn.execute(ADD_POINTS_SQL, (_pending_points,))
+    _pending_points = 0
+
+@contextlib.contextmanager
+def logging_transaction():
+    """Group log_action/log_posture_data calls into one transaction, committed on exit.
+
+    A failed write inside the block raises out of it and rolls back the whole batch.
+    """
+    global _log_batch, _pending_points
+    with _log_lock:
+        conn = _get_log_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        _log_batch = True
+        try:
+            yield conn
+            if _pending_points:
+                conn.execute(ADD_POINTS_SQL, (_pending_points,))
+            conn.execute("COMMIT")
+            _pending_points = 0
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            _log_batch = False
+
+def flush_points():
+    try:
+        with _log_lock:
+            if _pending_points:
+                _write_logs(_get_log_conn())
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+
+def close_log_connection():
+    global _log_conn
+    flush_points()
+    with _log_lock:
+        if _log_conn is not None:
+            _log_conn.close()
+            _log_conn = None
+
 # Database setup
 def setup_database():
     try:
-        with sqlite3.connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            c.execute('''CREATE TABLE IF NOT EXISTS health_logs (
-                            id INTEGER PRIMARY KEY,
-                            timestamp TEXT,
-                            action TEXT)''')
-            c.execute('''CREATE TABLE IF NOT EXISTS user_settings (
-                            id INTEGER PRIMARY KEY,
-                            hydration_interval INTEGER,
-                            break_interval INTEGER)''')
-            c.execute('''CREATE TABLE IF NOT EXISTS user_points (
-                            id INTEGER PRIMARY KEY,
-                            points INTEGER)''')
-            c.execute('''CREATE TABLE IF NOT EXISTS detailed_logs (
-                            id INTEGER PRIMARY KEY,
-                            timestamp TEXT,
-                            good_posture INTEGER,
-                            forward_lean_flag INTEGER,
-                            uneven_shoulders_flag INTEGER,
-                            back_angle REAL,
-                            forward_lean REAL,
-                            shoulder_alignment REAL,
-                            session_status TEXT,
-                            game TEXT)''')
-            c.execute('''INSERT OR IGNORE INTO user_settings (id, hydration_interval, break_interval)
-                         VALUES (1, ?, ?)''', (DEFAULT_HYDRATION_INTERVAL, DEFAULT_BREAK_INTERVAL))
-            c.execute('''INSERT OR IGNORE INTO user_points (id, points)
-                         VALUES (1, 0)''')
-            conn.commit()
+        with _log_lock:
+            # Built on the long-lived log connection: a shared-cache in-memory HT_DB_PATH
+            # database is dropped as soon as its last connection closes
+            conn = _get_log_conn()
+            # WAL is stored in the database file: readers stop blocking the log writer and
+            # commits append to the log instead of rewriting pages
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("BEGIN")
+                c = conn.cursor()
+                c.execute('''CREATE TABLE IF NOT EXISTS health_logs (
+                                id INTEGER PRIMARY KEY,
+                                timestamp TEXT,
+                                action TEXT)''')
+                c.execute('''CREATE TABLE IF NOT EXISTS user_settings (
+                                id INTEGER PRIMARY KEY,
+                                hydration_interval INTEGER,
+                                break_interval INTEGER)''')
+                c.execute('''CREATE TABLE IF NOT EXISTS user_points (
+                                id INTEGER PRIMARY KEY,
+                                points INTEGER)''')
+                c.execute('''CREATE TABLE IF NOT EXISTS detailed_logs (
+                                id INTEGER PRIMARY KEY,
+                                timestamp TEXT,
+                                good_posture INTEGER,
+                                forward_lean_flag INTEGER,
+                                uneven_shoulders_flag INTEGER,
+                                back_angle REAL,
+                                forward_lean REAL,
+                                shoulder_alignment REAL,
+                                session_status TEXT,
+                                game TEXT)''')
+                c.execute("CREATE INDEX IF NOT EXISTS idx_logs_ts ON detailed_logs(timestamp)")
+                # Covers the session_status filters (test cleanup, flag checks) without touching the table
+                c.execute("""CREATE INDEX IF NOT EXISTS idx_logs_status
+                             ON detailed_logs(session_status, good_posture, forward_lean_flag, uneven_shoulders_flag)""")
+                c.execute('''INSERT OR IGNORE INTO user_settings (id, hydration_interval, break_interval)
+                             VALUES (1, ?, ?)''', (DEFAULT_HYDRATION_INTERVAL, DEFAULT_BREAK_INTERVAL))
+                c.execute('''INSERT OR IGNORE INTO user_points (id, points)
+                             VALUES (1, 0)''')
     except sqlite3.Error as e:
         print(f"Database error: {e}")
 
+# Log timestamps are IST; every insert within the same second reuses one formatted string
+IST = pytz.timezone('Asia/Kolkata')
+
+@functools.lru_cache(maxsize=1)
+def _ist_timestamp(second):
+    return datetime.fromtimestamp(second, IST).strftime('%Y-%m-%d %H:%M:%S')
+
+def _log_row(timestamp, back_angle=None, forward_lean=None, shoulder_alignment=None, good_posture=None, forward_lean_flag=None, uneven_shoulders_flag=None, session_status=None, game=None):
+    # Parameters for INSERT_LOG_SQL, in column order
+    return (timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game)
+
 # Insert log into database
 def log_action(back_angle=None, forward_lean=None, shoulder_alignment=None, good_posture=None, forward_lean_flag=None, uneven_shoulders_flag=None, session_status=None, game=None):
-    try:
-        IST = pytz.timezone('Asia/Kolkata')
-        now_ist = datetime.now(IST).strftime('%Y-%m-%d %H:%M:%S')
-        with sqlite3.connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            c.execute('''INSERT INTO detailed_logs (timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game)
-                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                      (now_ist, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game))
-            conn.commit()
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
+    log_actions([dict(back_angle=back_angle, forward_lean=forward_lean, shoulder_alignment=shoulder_alignment,
+                      good_posture=good_posture, forward_lean_flag=forward_lean_flag,
+                      uneven_shoulders_flag=uneven_shoulders_flag, session_status=session_status, game=game)])
 
-# Add points for completing reminders
+def log_actions(entries):
+    """
+    Log several entries (dicts of log_action's keyword arguments) with one executemany.
+    """
+    now_ist = _ist_timestamp(int(time.time()))
+    rows = [_log_row(now_ist, **entry) for entry in entries]
+    with _log_lock:
+        try:
+            _write_logs(_get_log_conn(), *rows)
+        except sqlite3.Error as e:
+            if _log_batch:
+                # Inside logging_transaction(): let it roll back the whole batch
+                raise
+            print(f"Database error: {e}")
+
+# Add points for completing reminders; written with the next log_action (or flush_points)
 def add_points(points):
-    try:
-        with sqlite3.connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            c.execute("UPDATE user_points SET points = points + ? WHERE id = 1", (points,))
-            conn.commit()
-    except sqlite3.Error as e:
-        print(f"Database error: {e}")
+    global _pending_points
+    with _log_lock:
+        _pending_points += points
+
+# Reminder intervals (minutes), read once and kept in sync by SettingsDialog
+_settings_cache = None
+
+def get_settings():
+    global _settings_cache
+    if _settings_cache is None:
+        try:
+            with sqlite3.connect(DB_PATH, uri=True) as conn:
+                c = conn.cursor()
+                c.execute("SELECT hydration_interval, break_interval FROM user_settings WHERE id = 1")
+                _settings_cache = c.fetchone()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+        if _settings_cache is None:
+            return DEFAULT_HYDRATION_INTERVAL, DEFAULT_BREAK_INTERVAL
+    return _settings_cache
 
 # Health Tips
 HEALTH_TIPS = [
@@ -131,99 +269,151 @@ HEALTH_TIPS = [
     "Maintain a proper sitting posture."
 ]
 
+# Reminder notification titles and pre-formatted messages
+HYDRATION_TITLE = "Hydration Reminder"
+BREAK_TITLE = "Break Reminder"
+HYDRATION_MSGS = [f"{tip}\nTake a sip of water!" for tip in HEALTH_TIPS]
+BREAK_MSGS = [f"{tip}\nTake a 5-minute break!" for tip in HEALTH_TIPS]
+
+# Foreground app samples younger than this are shared between timers (seconds)
+GAME_POLL_TTL = 0.5
+
+# Video label size and the space its QSS padding (10px) + border (5px) take per side
+VIDEO_LABEL_SIZE = (940, 560)
+VIDEO_LABEL_INSET = 15
+
+# Upper bound on the video frame rate
+MAX_FPS = 30
+FRAME_INTERVAL = 1.0 / MAX_FPS
+
+# Widget styles, keyed by objectName and shared by both themes
+WIDGETS_QSS = """
+    QLabel#videoPanel {
+        border-radius: 20px;
+        background-color: #C8E0EC;
+        padding: 10px;
+        border: 5px solid #C8E0EC;
+    }
+    QLabel#postureFeedback {
+        background-color: grey;
+        border-radius: 20px;
+        padding: 10px;
+        font-size: 20px;
+        color: white;
+        font-weight: bold;
+    }
+    QLabel#gameStatus {
+        font-size: 20px;
+        padding: 10px;
+        color: grey;
+        font-weight: bold;
+    }
+    QLabel#gameStatus[state="running"] { color: green; }
+    QLabel#gameStatus[state="idle"] { color: red; }
+    QLabel#timerLabel {
+        padding: 5px;
+        font-size: 20px;
+        color: Black;
+        font-weight: bold;
+    }
+    QLabel#logsLabel {
+        background-color: grey;
+        border-radius: 10px;
+        padding: 5px;
+        font-size: 18px;
+        color: black;
+        font-weight: bold;
+    }
+    QListWidget#logList {
+        background-color: #b6d9c9;
+        border-radius: 15px;
+        padding: 3px;
+        font-size: 15px;
+        color: black;
+        font-weight: bold;
+        border: 2px solid #4CAF50;
+    }
+    QListWidget#logList::item { background-color: #b6d9c9; }
+    QListWidget#logList::item:alternate { background-color: #a8c9b9; }
+    QListWidget#logList::item:hover { background-color: #4CAF50; color: black; }
+    QPushButton#startButton, QPushButton#stopButton, QPushButton#settingsButton,
+    QPushButton#progressButton, QPushButton#darkModeButton, QPushButton#visualizeButton {
+        color: white;
+        border-radius: 15px;
+        padding: 10px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#startButton { background-color: #4CAF50; border: 2px solid #4CAF50; padding: 10px 30px; }
+    QPushButton#startButton:hover { background-color: #45a049; }
+    QPushButton#startButton:pressed { background-color: #3d8b40; }
+    QPushButton#stopButton { background-color: #f44336; border: 2px solid #f44336; }
+    QPushButton#stopButton:hover { background-color: #d32f2f; }
+    QPushButton#stopButton:pressed { background-color: #b71c1c; }
+    QPushButton#settingsButton { background-color: #2196F3; border: 2px solid #2196F3; }
+    QPushButton#settingsButton:hover { background-color: #1976D2; }
+    QPushButton#settingsButton:pressed { background-color: #0D47A1; }
+    QPushButton#progressButton { background-color: #9C27B0; border: 2px solid #9C27B0; }
+    QPushButton#progressButton:hover { background-color: #7B1FA2; }
+    QPushButton#progressButton:pressed { background-color: #4A148C; }
+    QPushButton#darkModeButton { background-color: #607D8B; border: 2px solid #607D8B; }
+    QPushButton#darkModeButton:hover { background-color: #455A64; }
+    QPushButton#darkModeButton:pressed { background-color: #37474F; }
+    QPushButton#visualizeButton { background-color: #3498db; border: 2px solid #3498db; }
+    QPushButton#visualizeButton:hover { background-color: #2980b9; }
+    QPushButton#visualizeButton:pressed { background-color: #2471a3; }
+"""
+
+LIGHT_QSS = """
+    QMainWindow { background-color: #f0f0f0; }
+    QLabel { font-size: 14px; color: #333; }
+    QListWidget { background-color: white; border-radius: 10px; padding: 10px; border: 1px solid #ccc; }
+    QLineEdit { border-radius: 10px; padding: 5px; border: 1px solid #ccc; }
+    QProgressBar { border-radius: 5px; text-align: center; }
+    QProgressBar::chunk { background-color: #4CAF50; border-radius: 5px; }
+""" + WIDGETS_QSS
+
+DARK_QSS = """
+    QMainWindow { background-color: #333; }
+    QLabel { font-size: 14px; color: white; }
+    QListWidget { background-color: #444; color: white; border-radius: 10px; padding: 10px; border: 1px solid #555; }
+    QLineEdit { border-radius: 10px; padding: 5px; border: 1px solid #555; }
+    QProgressBar { border-radius: 5px; text-align: center; }
+    QProgressBar::chunk { background-color: #666; border-radius: 5px; }
+""" + WIDGETS_QSS
+
 # Video Feed Worker Thread
 class VideoWorker(QThread):
-    frame_ready = pyqtSignal(QPixmap, str, float, float, float)
-    
+    frame_ready = pyqtSignal(QImage, str, float, float, float)
+
     def __init__(self, posture_detector):
         super().__init__()
         self.posture_detector = posture_detector
         self.running = True
-        
+
     def run(self):
         while self.running:
-            pixmap, feedback, back_angle, forward_lean, shoulder_diff = self.posture_detector.get_frame()
-            if pixmap is not None:
+            started = time.monotonic()
+            image, feedback, back_angle, forward_lean, shoulder_diff = self.posture_detector.get_frame()
+            if image is not None:
                 back_angle = back_angle if back_angle is not None else 0.0
                 forward_lean = forward_lean if forward_lean is not None else 0.0
                 shoulder_diff = shoulder_diff if shoulder_diff is not None else 0.0
-                self.frame_ready.emit(pixmap, feedback, back_angle, forward_lean, shoulder_diff)
-            time.sleep(0.033)  # ~30 fps
+                self.frame_ready.emit(image, feedback, back_angle, forward_lean, shoulder_diff)
+            # get_frame() blocks until the capture thread delivers the next frame, so
+            # this only sleeps when it returned early (e.g. read failure)
+            remaining = FRAME_INTERVAL - (time.monotonic() - started)
+            if remaining > 0:
+                self.msleep(int(remaining * 1000))
     
     def stop(self):
         self.running = False
         print("[VideoWorker] Video thread stopped.")
 
-# Reminder Worker Thread
-class ReminderWorker(QThread):
-    notification_sent = pyqtSignal(str, str, bool)  # message, type, game_running
-    
-    def __init__(self):
-        super().__init__()
-        self.running = True
-        
-    def run(self):
-        try:
-            with sqlite3.connect("health_tracker.db") as conn:
-                c = conn.cursor()
-                c.execute("SELECT hydration_interval, break_interval FROM user_settings WHERE id = 1")
-                hydration_interval, break_interval = c.fetchone()
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            hydration_interval, break_interval = DEFAULT_HYDRATION_INTERVAL, DEFAULT_BREAK_INTERVAL
-
-        hydration_interval *= 60
-        break_interval *= 60
-
-        last_hydration_reminder = time.time()
-        last_break_reminder = time.time()
-
-        toaster = ToastNotifier()
-
-        while self.running:
-            current_time = time.time()
-            title, exe = get_foreground_app()
-            game_name = exe or title or "Unknown"
-            if game_name and game_name != "Unknown":
-                if current_time - last_hydration_reminder >= hydration_interval:
-                    try:
-                        notification.notify(
-                            title="Hydration Reminder",
-                            message=f"{random.choice(HEALTH_TIPS)}\nTake a sip of water!",
-                            timeout=10
-                        )
-                    except:
-                        toaster.show_toast("Hydration Reminder", f"{random.choice(HEALTH_TIPS)}\nTake a sip of water!",
-                                        duration=10)
-                    
-                    self.notification_sent.emit(f"Hydration reminder sent", "hydration", True)
-                    log_action(back_angle=0, forward_lean=0, shoulder_alignment=0, good_posture=1, forward_lean_flag=0, uneven_shoulders_flag=0, session_status="Running", game=game_name)
-                    add_points(5)
-                    last_hydration_reminder = current_time
-
-                if current_time - last_break_reminder >= break_interval:
-                    try:
-                        notification.notify(
-                            title="Break Reminder",
-                            message=f"{random.choice(HEALTH_TIPS)}\nTake a 5-minute break!",
-                            timeout=10
-                        )
-                    except:
-                        toaster.show_toast("Break Reminder", f"{random.choice(HEALTH_TIPS)}\nTake a 5-minute break!",
-                                        duration=10)
-                    
-                    self.notification_sent.emit(f"Break reminder sent", "break", True)
-                    log_action(back_angle=0, forward_lean=0, shoulder_alignment=0, good_posture=0, forward_lean_flag=0, uneven_shoulders_flag=0, session_status="Running", game=game_name)
-                    add_points(10)
-                    last_break_reminder = current_time
-
-            time.sleep(1)
-    
-    def stop(self):
-        self.running = False
-
 # Settings Dialog
 class SettingsDialog(QDialog):
+    settings_changed = pyqtSignal(int, int)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Customize Settings")
@@ -249,27 +439,24 @@ class SettingsDialog(QDialog):
         self.setLayout(layout)
         
         # Load current settings
-        try:
-            with sqlite3.connect("health_tracker.db") as conn:
-                c = conn.cursor()
-                c.execute("SELECT hydration_interval, break_interval FROM user_settings WHERE id = 1")
-                hydration_interval, break_interval = c.fetchone()
-                self.hydration_entry.setText(str(hydration_interval))
-                self.break_entry.setText(str(break_interval))
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
+        hydration_interval, break_interval = get_settings()
+        self.hydration_entry.setText(str(hydration_interval))
+        self.break_entry.setText(str(break_interval))
         
     def save_settings(self):
+        global _settings_cache
         try:
             hydration = int(self.hydration_entry.text()) if self.hydration_entry.text() else DEFAULT_HYDRATION_INTERVAL
             break_time = int(self.break_entry.text()) if self.break_entry.text() else DEFAULT_BREAK_INTERVAL
             
             try:
-                with sqlite3.connect("health_tracker.db") as conn:
+                with sqlite3.connect(DB_PATH, uri=True) as conn:
                     c = conn.cursor()
                     c.execute("UPDATE user_settings SET hydration_interval = ?, break_interval = ? WHERE id = 1",
                             (hydration, break_time))
                     conn.commit()
+                _settings_cache = (hydration, break_time)
+                self.settings_changed.emit(hydration, break_time)
             except sqlite3.Error as e:
                 print(f"Database error: {e}")
             
@@ -286,8 +473,14 @@ class HealthTracker(QMainWindow):
         self.last_log_time = time.time()
         self.theme = "Light"
         
-        # Initialize posture detector
-        self.posture_detector = PostureDetector()
+        # Initialize posture detector (imported here so scripts that only need the logging
+        # helpers don't pay for cv2/numba at import time)
+        from posture_detection import PostureDetector
+        # Frames arrive pre-scaled to the label's content area so Qt never rescales them
+        self.posture_detector = PostureDetector(display_size=(
+            VIDEO_LABEL_SIZE[0] - 2 * VIDEO_LABEL_INSET,
+            VIDEO_LABEL_SIZE[1] - 2 * VIDEO_LABEL_INSET,
+        ))
         if not self.posture_detector.initialize_camera():
             QMessageBox.critical(self, "Error", "Could not initialize camera")
             sys.exit(1)
@@ -295,6 +488,14 @@ class HealthTracker(QMainWindow):
         # State variables
         self.running = False
         self.start_time = None
+        self._last_feedback = None
+        self._game_name = "Unknown"
+        self._game_checked_at = float("-inf")
+        self._last_game_state = None
+        self._logs_last_id = None
+        self._graph_last_id = 0
+        self._graph_timestamps = np.array([], dtype='datetime64[s]')
+        self._graph_series = ([], [], [])
         
         # Create main layout
         self.main_layout = QHBoxLayout()
@@ -307,44 +508,19 @@ class HealthTracker(QMainWindow):
         # Video feed
         self.video_label = QLabel()
         self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.video_label.setScaledContents(True)
-        self.video_label.setStyleSheet("""
-            QLabel {
-                border-radius: 20px;
-                background-color: #C8E0EC;
-                padding: 10px;
-                border: 5px solid #C8E0EC;
-            }
-        """)
-        self.video_label.setFixedSize(940, 560)
+        self.video_label.setScaledContents(False)
+        self.video_label.setObjectName("videoPanel")
+        self.video_label.setFixedSize(*VIDEO_LABEL_SIZE)
         self.left_layout.addWidget(self.video_label)
         
         # Posture feedback label
         self.posture_feedback = QLabel("Posture Status: Analyzing...")
-        self.posture_feedback.setStyleSheet("""
-            QLabel {
-                background-color: grey;
-                border-radius: 20px;
-                padding: 10px;
-                font-size: 20px;
-                color: white;
-                font-weight: bold;
-            }
-        """)
+        self.posture_feedback.setObjectName("postureFeedback")
         self.left_layout.addWidget(self.posture_feedback)
         
         # Game status label
         self.game_status = QLabel("Game Status: Not Running")
-        self.game_status.setStyleSheet("""
-            QLabel {
-                font-size: 20px;
-                padding:10px;        
-                color: grey;
-                font-weight: bold;
-
-            }
-        """)
-        # self.right_layout.addWidget(self.game_status)
+        self.game_status.setObjectName("gameStatus")
         self.left_layout.addWidget(self.game_status)
         # Right frame for controls and logs
         self.right_frame = QWidget()
@@ -354,14 +530,7 @@ class HealthTracker(QMainWindow):
         
         # Session timer
         self.timer_label = QLabel("Session Timer: 0 seconds")
-        self.timer_label.setStyleSheet("""
-            QLabel {
-                padding: 5px;
-                font-size: 20px;
-                color: Black;
-                font-weight: bold;
-            }
-        """)
+        self.timer_label.setObjectName("timerLabel")
         self.right_layout.addWidget(self.timer_label)
         
         # Button layout
@@ -369,45 +538,13 @@ class HealthTracker(QMainWindow):
         
         # Start button
         self.start_button = QPushButton("Start")
-        self.start_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 15px;
-                padding: 10px 30px;
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #4CAF50;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.start_button.setObjectName("startButton")
         self.start_button.clicked.connect(self.start_session)
         button_layout.addWidget(self.start_button)
         
         # Stop button
         self.stop_button = QPushButton("Stop")
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border-radius: 15px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #f44336;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-            QPushButton:pressed {
-                background-color: #b71c1c;
-            }
-        """)
+        self.stop_button.setObjectName("stopButton")
         self.stop_button.clicked.connect(self.stop_session)
         button_layout.addWidget(self.stop_button)
         
@@ -417,62 +554,13 @@ class HealthTracker(QMainWindow):
         self.logs_label = QLabel("Recent Logs:")
         self.logs_label.setFixedHeight(30)
 
-        self.logs_label.setStyleSheet("""
-            QLabel {
-                background-color: grey;
-                border-radius: 10px;
-                padding: 5px;
-                font-size: 18px;
-                color: black;
-                font-weight: bold;
-            }
-        """)
+        self.logs_label.setObjectName("logsLabel")
         self.right_layout.addWidget(self.logs_label)
         
         self.log_list = QListWidget()
         self.log_list.setMinimumHeight(300)
         self.right_layout.addWidget(self.log_list, stretch=1)
-        self.log_list.setStyleSheet("""
-            QListWidget {
-                background-color: #b6d9c9;
-                border-radius: 15px;
-                padding: 3px;
-                font-size: 15px;
-                color: black;
-                font-weight: bold;
-                border: 2px solid #4CAF50;
-            }
-            QListWidget::item {
-                background-color: #b6d9c9;
-            }
-            QListWidget::item:alternate {
-                background-color: #a8c9b9;
-            }
-            QListWidget::item:hover {
-                background-color: #4CAF50;
-                color: black;
-            }
-                QListWidget::horizontal-scrollbar {
-                background-color: #b6d9c9;
-                width: 5px;
-                margin: 0px;
-            }
-            QListWidget::vertical-scrollbar {
-                background-color: #b6d9c9;
-                width: 10px;
-                margin: 0px;
-            }
-             QListWidget::vertical-scrollbar:: handle {
-                background-color: #b6d9c9;
-                width: 5px;
-                margin: 0px;
-            }
-            QListWidget::vertical-scrollbar::handle {
-                background-color: #4CAF50;
-                border-radius: 5px;
-            }
-        """)
-        self.right_layout.addWidget(self.log_list)
+        self.log_list.setObjectName("logList")
     
         
         # Other buttons layout
@@ -482,89 +570,25 @@ class HealthTracker(QMainWindow):
         
         # Settings button
         self.settings_button = QPushButton("Customize Settings")
-        self.settings_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border-radius: 15px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #2196F3;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-        """)
+        self.settings_button.setObjectName("settingsButton")
         self.settings_button.clicked.connect(self.open_settings)
         other_buttons_layout.addWidget(self.settings_button, 0, 0)
         
         # Progress button
         self.progress_button = QPushButton("View Progress")
-        self.progress_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9C27B0;
-                color: white;
-                border-radius: 15px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #9C27B0;
-            }
-            QPushButton:hover {
-                background-color: #7B1FA2;
-            }
-            QPushButton:pressed {
-                background-color: #4A148C;
-            }
-        """)
+        self.progress_button.setObjectName("progressButton")
         self.progress_button.clicked.connect(self.show_graph)
         other_buttons_layout.addWidget(self.progress_button, 0, 1)
         
         # Dark mode button
         self.dark_mode_button = QPushButton("Toggle Dark Mode")
-        self.dark_mode_button.setStyleSheet("""
-            QPushButton {
-                background-color: #607D8B;
-                color: white;
-                border-radius: 15px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #607D8B;
-            }
-            QPushButton:hover {
-                background-color: #455A64;
-            }
-            QPushButton:pressed {
-                background-color: #37474F;
-            }
-        """)
+        self.dark_mode_button.setObjectName("darkModeButton")
         self.dark_mode_button.clicked.connect(self.toggle_theme)
         other_buttons_layout.addWidget(self.dark_mode_button, 1, 1)
         
         # Remove Export button and add Visualize Dashboard button
         self.visualize_button = QPushButton("Visualize Dashboard")
-        self.visualize_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border-radius: 15px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                border: 2px solid #3498db;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #2471a3;
-            }
-        """)
+        self.visualize_button.setObjectName("visualizeButton")
         self.visualize_button.clicked.connect(self.open_dashboard)
         other_buttons_layout.addWidget(self.visualize_button, 1, 0)
 
@@ -582,10 +606,14 @@ class HealthTracker(QMainWindow):
         # Start video feed
         self.start_video_feed()
         
-        # Start reminder thread
-        self.reminder_thread = ReminderWorker()
-        self.reminder_thread.notification_sent.connect(self.handle_notification)
-        self.reminder_thread.start()
+        # Reminder checks run on the GUI event loop; they only compare timestamps
+        self.load_reminder_intervals()
+        self.last_hydration_reminder = time.time()
+        self.last_break_reminder = time.time()
+        self.toaster = None
+        self.reminder_timer = QTimer(self)
+        self.reminder_timer.timeout.connect(self.check_reminders)
+        self.reminder_timer.start(1000)
         
         # Timer for session updates
         self.timer = QTimer()
@@ -603,24 +631,8 @@ class HealthTracker(QMainWindow):
         self.apply_styles()
     
     def apply_styles(self):
-        if self.theme == "Light":
-            self.setStyleSheet("""
-                QMainWindow { background-color: #f0f0f0; }
-                QLabel { font-size: 14px; color: #333; }
-                QListWidget { background-color: white; border-radius: 10px; padding: 10px; border: 1px solid #ccc; }
-                QLineEdit { border-radius: 10px; padding: 5px; border: 1px solid #ccc; }
-                QProgressBar { border-radius: 5px; text-align: center; }
-                QProgressBar::chunk { background-color: #4CAF50; border-radius: 5px; }
-            """)
-        else:
-            self.setStyleSheet("""
-                QMainWindow { background-color: #333; }
-                QLabel { font-size: 14px; color: white; }
-                QListWidget { background-color: #444; color: white; border-radius: 10px; padding: 10px; border: 1px solid #555; }
-                QLineEdit { border-radius: 10px; padding: 5px; border: 1px solid #555; }
-                QProgressBar { border-radius: 5px; text-align: center; }
-                QProgressBar::chunk { background-color: #666; border-radius: 5px; }
-            """)
+        # One application-wide sheet per theme; widgets are matched by objectName
+        QApplication.instance().setStyleSheet(LIGHT_QSS if self.theme == "Light" else DARK_QSS)
     
     def toggle_theme(self):
         self.theme = "Dark" if self.theme == "Light" else "Light"
@@ -631,15 +643,17 @@ class HealthTracker(QMainWindow):
         self.video_thread.frame_ready.connect(self.update_frame)
         self.video_thread.start()
     
-    def update_frame(self, pixmap, feedback, back_angle, forward_lean, shoulder_diff):
-        self.video_label.setPixmap(pixmap)
-        self.posture_feedback.setText(f"Posture Status: {feedback}")
+    def update_frame(self, image, feedback, back_angle, forward_lean, shoulder_diff):
+        self.video_label.setPixmap(QPixmap.fromImage(image))
+        # setText relayouts the label, so skip it while the feedback is unchanged
+        if feedback != self._last_feedback:
+            self._last_feedback = feedback
+            self.posture_feedback.setText(f"Posture Status: {feedback}")
         # Log aggregated data every 30 seconds
         current_time = time.time()
         if current_time - self.last_log_time >= 30 and self.running:
             aggregated_posture = self.posture_detector.get_aggregated_posture()
-            title, exe = get_foreground_app()
-            game_name = exe or title or "Unknown"
+            game_name = self.current_game()
             log_posture_data(aggregated_posture, back_angle, forward_lean, shoulder_diff, game_name)
             self.last_log_time = current_time
     
@@ -662,50 +676,113 @@ class HealthTracker(QMainWindow):
         if self.running and self.start_time is not None:
             elapsed = int(time.time() - self.start_time)
             self.timer_label.setText(f"Session Timer: {elapsed} seconds")
-            
-            title, exe = get_foreground_app()
-            game_name = exe or title or "Unknown"
-            if game_name and game_name != "Unknown":
+
+            game_name = self.current_game()
+            game_state = (game_name != "Unknown", game_name)
+            # Only touch the label when the game changes; a re-polish restyles it
+            if game_state == self._last_game_state:
+                return
+            self._last_game_state = game_state
+            if game_state[0]:
                 self.game_status.setText(f"Game Status: Running ({game_name})")
-                self.game_status.setStyleSheet("color: green; font-size:20; font-weight:bold;")
+                self.game_status.setProperty("state", "running")
             else:
                 self.game_status.setText("Game Status: Not Running")
-                self.game_status.setStyleSheet("color: red;font-size:20; font-weight:bold;")
+                self.game_status.setProperty("state", "idle")
+            self.game_status.style().unpolish(self.game_status)
+            self.game_status.style().polish(self.game_status)
+
+    def current_game(self):
+        """Return the foreground app name, sampled at most once per timer tick."""
+        now = time.monotonic()
+        if now - self._game_checked_at >= GAME_POLL_TTL:
+            title, exe = get_foreground_app()
+            self._game_name = exe or title or "Unknown"
+            self._game_checked_at = now
+        return self._game_name
     
     def update_logs(self):
         try:
-            with sqlite3.connect("health_tracker.db") as conn:
+            with sqlite3.connect(DB_PATH, uri=True) as conn:
                 c = conn.cursor()
                 c.execute("SELECT id, timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game FROM detailed_logs ORDER BY id DESC LIMIT 8")
                 rows = c.fetchall()
-                self.log_list.clear()
-                for row in rows:
-                    # Unpack fields
-                    _id, timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game = row
-                    # Parse time for display
-                    try:
-                        time_str = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").strftime("%H:%M")
-                    except Exception:
-                        time_str = timestamp
-                    # Build friendly message (mutually exclusive)
-                    if session_status == "Started":
-                        msg = f"🟢 Session started at {time_str} ({game or 'Unknown app'})"
-                    elif session_status == "Stopped":
-                        msg = f"🔴 Session stopped at {time_str} ({game or 'Unknown app'})"
-                    elif forward_lean_flag and uneven_shoulders_flag:
-                        msg = f"⚠️ FL & US detected in {game or 'Unknown app'} at {time_str}"
-                    elif forward_lean_flag:
-                        msg = f"⚠️ Forward lean detected in {game or 'Unknown app'} at {time_str}"
-                    elif uneven_shoulders_flag:
-                        msg = f"⚠️ Uneven shoulders detected in {game or 'Unknown app'} at {time_str}"
-                    elif good_posture:
-                        msg = f"✅ Good posture in {game or 'Unknown app'} at {time_str}"
-                    else:
-                        msg = f"ℹ️ Posture event in {game or 'Unknown app'} at {time_str}"
-                    self.log_list.addItem(msg)
         except sqlite3.Error as e:
             print(f"Database error: {e}")
+            return
+
+        # Nothing new since the last refresh; keep the list (and any reminder items) as is
+        newest_id = rows[0][0] if rows else None
+        if newest_id == self._logs_last_id:
+            return
+        self._logs_last_id = newest_id
+
+        items = []
+        for row in rows:
+            # Unpack fields
+            _id, timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game = row
+            # Parse time for display
+            try:
+                time_str = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S").strftime("%H:%M")
+            except Exception:
+                time_str = timestamp
+            # Build friendly message (mutually exclusive)
+            if session_status == "Started":
+                msg = f"🟢 Session started at {time_str} ({game or 'Unknown app'})"
+            elif session_status == "Stopped":
+                msg = f"🔴 Session stopped at {time_str} ({game or 'Unknown app'})"
+            elif forward_lean_flag and uneven_shoulders_flag:
+                msg = f"⚠️ FL & US detected in {game or 'Unknown app'} at {time_str}"
+            elif forward_lean_flag:
+                msg = f"⚠️ Forward lean detected in {game or 'Unknown app'} at {time_str}"
+            elif uneven_shoulders_flag:
+                msg = f"⚠️ Uneven shoulders detected in {game or 'Unknown app'} at {time_str}"
+            elif good_posture:
+                msg = f"✅ Good posture in {game or 'Unknown app'} at {time_str}"
+            else:
+                msg = f"ℹ️ Posture event in {game or 'Unknown app'} at {time_str}"
+            items.append(msg)
+        self.log_list.clear()
+        self.log_list.addItems(items)
     
+    def load_reminder_intervals(self):
+        self.set_reminder_intervals(*get_settings())
+
+    def set_reminder_intervals(self, hydration_interval, break_interval):
+        self.hydration_interval = hydration_interval * 60
+        self.break_interval = break_interval * 60
+
+    def check_reminders(self):
+        current_time = time.time()
+        game_name = self.current_game()
+        if game_name and game_name != "Unknown":
+            if current_time - self.last_hydration_reminder >= self.hydration_interval:
+                self.send_notification(HYDRATION_TITLE, random.choice(HYDRATION_MSGS))
+
+                self.handle_notification("Hydration reminder sent", "hydration", True)
+                add_points(5)
+                log_action(back_angle=0, forward_lean=0, shoulder_alignment=0, good_posture=1, forward_lean_flag=0, uneven_shoulders_flag=0, session_status="Running", game=game_name)
+                self.last_hydration_reminder = current_time
+
+            if current_time - self.last_break_reminder >= self.break_interval:
+                self.send_notification(BREAK_TITLE, random.choice(BREAK_MSGS))
+
+                self.handle_notification("Break reminder sent", "break", True)
+                add_points(10)
+                log_action(back_angle=0, forward_lean=0, shoulder_alignment=0, good_posture=0, forward_lean_flag=0, uneven_shoulders_flag=0, session_status="Running", game=game_name)
+                self.last_break_reminder = current_time
+
+    def send_notification(self, title, message):
+        # Notification backends are imported on the first reminder, not at startup
+        try:
+            from plyer import notification
+            notification.notify(title=title, message=message, timeout=10)
+        except Exception:
+            if self.toaster is None:
+                from win10toast import ToastNotifier
+                self.toaster = ToastNotifier()
+            self.toaster.show_toast(title, message, duration=10, threaded=True)
+
     def handle_notification(self, message, notification_type, game_running):
         if game_running:
             item = QListWidgetItem(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {message}")
@@ -717,31 +794,39 @@ class HealthTracker(QMainWindow):
     
     def open_settings(self):
         dialog = SettingsDialog(self)
+        dialog.settings_changed.connect(self.set_reminder_intervals)
         dialog.exec()
     
     def show_graph(self):
+        import matplotlib.pyplot as plt
+
+        # Only rows added since the last press are fetched and parsed
         try:
-            with sqlite3.connect("health_tracker.db") as conn:
+            with sqlite3.connect(DB_PATH, uri=True) as conn:
                 c = conn.cursor()
-                c.execute("SELECT id, timestamp, good_posture, forward_lean_flag, uneven_shoulders_flag, back_angle, forward_lean, shoulder_alignment, session_status, game FROM detailed_logs")
+                c.execute("""SELECT id, timestamp, back_angle, forward_lean, shoulder_alignment
+                             FROM detailed_logs WHERE id > ? ORDER BY id""", (self._graph_last_id,))
                 data = c.fetchall()
         except sqlite3.Error as e:
             print(f"Database error: {e}")
             data = []
 
-        if not data:
+        if data:
+            self._graph_last_id = data[-1][0]
+            _, new_timestamps, new_back, new_forward, new_shoulder = zip(*data)
+            self._graph_timestamps = np.concatenate(
+                (self._graph_timestamps, np.array(new_timestamps, dtype='datetime64[s]')))
+            back_angles, forward_leans, shoulder_alignments = self._graph_series
+            back_angles.extend(new_back)
+            forward_leans.extend(new_forward)
+            shoulder_alignments.extend(new_shoulder)
+
+        if not self._graph_timestamps.size:
             QMessageBox.information(self, "No Data", "No data available to display.")
             return
 
-        timestamps = [datetime.strptime(row[0], "%Y-%m-%d %H:%M:%S") for row in data]
-        back_angles = [row[5] for row in data]
-        forward_leans = [row[6] for row in data]
-        shoulder_alignments = [row[7] for row in data]
-        good_postures = [row[2] for row in data]
-        forward_lean_flags = [row[3] for row in data]
-        uneven_shoulders_flags = [row[4] for row in data]
-        session_statuses = [row[8] for row in data]
-        games = [row[9] for row in data]
+        timestamps = self._graph_timestamps
+        back_angles, forward_leans, shoulder_alignments = self._graph_series
 
         plt.figure(figsize=(10, 5))
         plt.plot(timestamps, back_angles, label="Back Angle")
@@ -762,10 +847,11 @@ class HealthTracker(QMainWindow):
         # Clean up all resources and threads on app exit
         print("[HealthTracker] Cleaning up resources...")
         self.video_thread.stop()
-        self.reminder_thread.stop()
+        self.reminder_timer.stop()
         self.posture_detector.release()
         self.timer.stop()
         self.logs_timer.stop()
+        close_log_connection()
         print("[HealthTracker] Cleanup complete.")
 
     def open_dashboard(self):
@@ -783,10 +869,8 @@ class HealthTracker(QMainWindow):
             QMessageBox.critical(self, "Dashboard Error", f"Failed to open dashboard: {e}")
 
 # Enhanced posture logging function
-def log_posture_data(feedback, back_angle, forward_lean, shoulder_diff, game_name=None):
-    """
-    Log posture data with new flag columns.
-    """
+def _posture_flags(feedback):
+    """Return (good_posture, forward_lean_flag, uneven_shoulders_flag) for a feedback string"""
     # Default all flags to 0
     good_posture = 0
     forward_lean_flag = 0
@@ -803,7 +887,12 @@ def log_posture_data(feedback, back_angle, forward_lean, shoulder_diff, game_nam
     if good_posture:
         forward_lean_flag = 0
         uneven_shoulders_flag = 0
-    log_action(
+    return good_posture, forward_lean_flag, uneven_shoulders_flag
+
+def _posture_entry(feedback, back_angle, forward_lean, shoulder_diff, game_name=None):
+    """log_actions entry for one posture sample"""
+    good_posture, forward_lean_flag, uneven_shoulders_flag = _posture_flags(feedback)
+    return dict(
         back_angle=back_angle,
         forward_lean=forward_lean,
         shoulder_alignment=shoulder_diff,
@@ -814,6 +903,18 @@ def log_posture_data(feedback, back_angle, forward_lean, shoulder_diff, game_nam
         game=game_name
     )
 
+def log_posture_data(feedback, back_angle, forward_lean, shoulder_diff, game_name=None):
+    """
+    Log posture data with new flag columns.
+    """
+    log_actions([_posture_entry(feedback, back_angle, forward_lean, shoulder_diff, game_name)])
+
+def log_posture_data_many(samples):
+    """
+    Log several posture samples (dicts of log_posture_data's arguments) in one transaction.
+    """
+    log_actions([_posture_entry(**sample) for sample in samples])
+
 def main():
     if getattr(sys, 'frozen', False):
         print('[DEBUG] Running in PyInstaller packaged mode')
@@ -4,16 +4,29 @@ from sklearn.ensemble import RandomForestClassifier, IsolationForest
 from sklearn.metrics import classification_report, accuracy_score
 import matplotlib.pyplot as plt
 
+NUMERIC_COLUMNS = ['Back Angle', 'Forward Lean', 'Shoulder Alignment']
+# float32 is plenty for the landmark-derived metrics and halves the frame; also skips dtype inference
+CSV_DTYPES = {col: 'float32' for col in NUMERIC_COLUMNS}
+# The format main3 logs timestamps in; giving it to to_datetime skips per-value format inference
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 class FatigueLevelPredictor:
-    def __init__(self, filepath):
+    def __init__(self, filepath=None, data=None):
+        """Pass data to reuse a DataFrame the caller already loaded instead of re-reading filepath"""
         self.filepath = filepath
+        self._source = data
         self.data = None
         self.model = None
 
     def load_data(self):
         """Load and preprocess the CSV data"""
         try:
-            self.data = pd.read_csv(self.filepath, parse_dates=['Timestamp'])
+            if self._source is not None:
+                # Copy so the label/anomaly columns added here don't leak into the caller's frame
+                self.data = self._source.copy()
+            else:
+                self.data = pd.read_csv(self.filepath, dtype=CSV_DTYPES)
+                self.data['Timestamp'] = pd.to_datetime(self.data['Timestamp'], format=TIMESTAMP_FORMAT)
             self._clean_data()
         except Exception as e:
             print(f"Error loading data: {e}")
@@ -23,11 +36,10 @@ class FatigueLevelPredictor:
         # Remove duplicates
         self.data = self.data.drop_duplicates()
 
-        # Fill missing values safely
-        numeric_columns = ['Back Angle', 'Forward Lean', 'Shoulder Alignment']
-        for col in numeric_columns:
-            if col in self.data.columns:
-                self.data[col] = self.data[col].fillna(self.data[col].median())
+        # Fill missing values safely; all medians in one pass, then one fillna over the block
+        cols = [col for col in NUMERIC_COLUMNS if col in self.data.columns]
+        if cols:
+            self.data[cols] = self.data[cols].fillna(self.data[cols].median())
 
         # Create the label 'Fatigue Level' column based on user input
         self.data['Fatigue Level'] = self.data.apply(self.get_fatigue_label, axis=1)
@@ -63,7 +75,7 @@ class FatigueLevelPredictor:
 
         # Visualize the actual vs predicted fatigue levels
         plt.figure(figsize=(8, 6))
-        plt.scatter(X_test['Back Angle'], X_test['Shoulder Alignment'], c=y_pred, cmap='coolwarm', s=100, edgecolors='k')
+        plt.scatter(X_test['Back Angle'].to_numpy(), X_test['Shoulder Alignment'].to_numpy(), c=y_pred, cmap='coolwarm', s=100, edgecolors='k')
         plt.title('Actual vs Predicted Fatigue Level')
         plt.xlabel('Back Angle (°)')
         plt.ylabel('Shoulder Alignment (cm)')
@@ -81,17 +93,18 @@ class FatigueLevelPredictor:
         # Predict anomalies (1 = normal, -1 = anomaly)
         self.data['Anomaly'] = model.predict(X)
 
-        # Visualize the anomalies
-        normal = self.data[self.data['Anomaly'] == 1]
-        abnormal = self.data[self.data['Anomaly'] == -1]
+        # Visualize the anomalies; mask the raw arrays rather than copying two sub-frames
+        back_angle = self.data['Back Angle'].to_numpy()
+        shoulder = self.data['Shoulder Alignment'].to_numpy()
+        abnormal = self.data['Anomaly'].to_numpy() == -1
 
         plt.figure(figsize=(10, 6))
 
         # Plot normal data
-        plt.scatter(normal['Back Angle'], normal['Shoulder Alignment'], color='g', label='Normal', alpha=0.6)
+        plt.scatter(back_angle[~abnormal], shoulder[~abnormal], color='g', label='Normal', alpha=0.6)
 
         # Plot abnormal data
-        plt.scatter(abnormal['Back Angle'], abnormal['Shoulder Alignment'], color='r', label='Anomaly', alpha=0.6)
+        plt.scatter(back_angle[abnormal], shoulder[abnormal], color='r', label='Anomaly', alpha=0.6)
 
         plt.title('Posture Data Anomalies Detection')
         plt.xlabel('Back Angle (°)')
@@ -1,29 +1,107 @@
 import cv2
 import numpy as np
-from PyQt6.QtGui import QImage, QPixmap
-from collections import deque
-from statistics import mode
+from PyQt6.QtGui import QImage
+from collections import Counter, deque
+import math
+import queue
 import sys
-from PyQt6.QtWidgets import QMessageBox
+import threading
 try:
-    from app.config import POSTURE_BUFFER_SIZE, MOTION_THRESHOLD
+    from numba import njit
 except ImportError:
-    from config import POSTURE_BUFFER_SIZE, MOTION_THRESHOLD
+    njit = None
+try:
+    from app.config import POSTURE_BUFFER_SIZE, MOTION_THRESHOLD, STATIC_FRAME_THRESHOLD
+except ImportError:
+    from config import POSTURE_BUFFER_SIZE, MOTION_THRESHOLD, STATIC_FRAME_THRESHOLD
+
+# Size frames are processed at (width, height); requested from the driver so no resize is needed
+FRAME_SIZE = (640, 480)
+CAMERA_FPS = 30
+# Size frames are downscaled to for pose inference (keeps FRAME_SIZE's 4:3 aspect)
+INFERENCE_SIZE = (256, 192)
+# Size of the grayscale thumbnail used to detect unchanged frames
+GATE_SIZE = (80, 60)
+# Run pose inference on every Nth frame; the frames in between reuse the last landmarks
+POSE_INFERENCE_STRIDE = 2
+
+# MediaPipe Pose landmark indices used by the posture metrics
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_HIP = 23
+# Landmarks the per-frame kernel reads; only these are copied out of the MediaPipe result
+POSTURE_LANDMARKS = (LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP)
+
+# analyze_pose reports a posture issue when a metric exceeds its limit
+SHOULDER_DIFF_LIMIT = 0.05
+FORWARD_LEAN_LIMIT = 0.1
+
+def _posture_feedback(shoulder_diff, forward_lean):
+    """Feedback string for one frame's metrics"""
+    issues = []
+    if shoulder_diff > SHOULDER_DIFF_LIMIT:
+        issues.append("Uneven shoulders")
+    if forward_lean > FORWARD_LEAN_LIMIT:
+        issues.append("Forward lean")
+    return "Bad posture: " + ", ".join(issues) if issues else "Good posture"
+
+def _posture_kernel(lx, ly):
+    """Per-frame posture math on landmark x/y arrays; compiled with numba when available"""
+    shoulder_diff = abs(ly[LEFT_SHOULDER] - ly[RIGHT_SHOULDER])
+    forward_lean = abs(lx[LEFT_SHOULDER] - lx[LEFT_HIP])
+    back_angle = math.degrees(math.atan2(ly[LEFT_SHOULDER] - ly[LEFT_HIP], lx[LEFT_SHOULDER] - lx[LEFT_HIP]))
+    return shoulder_diff, forward_lean, back_angle
+
+if njit is not None:
+    _posture_kernel = njit(cache=True, fastmath=True)(_posture_kernel)
+
+# How long get_frame waits for the capture thread before reporting a failed read (seconds)
+CAPTURE_TIMEOUT = 1.0
 
 class PostureDetector:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, display_size=None):
         self.cap = None
+        # Camera frames are read on their own thread; only the newest one is kept
+        self._frame_q = queue.Queue(maxsize=1)
+        self._stop_capture = threading.Event()
+        self._capture_thread = None
         self.current_feedback = "No posture data"
         self.posture_buffer = deque(maxlen=POSTURE_BUFFER_SIZE)
+        # Running count of each feedback string in posture_buffer
+        self._posture_counts = Counter()
         self.mediapipe_available = False
         self.headless = headless
+        # (width, height) the GUI shows frames at; frames are scaled to it once here
+        self.display_size = display_size
+
+        # Per-frame image buffers, reused via dst= instead of allocating new arrays each frame
+        self._bgr = np.empty((FRAME_SIZE[1], FRAME_SIZE[0], 3), dtype=np.uint8)
+        self._rgb = np.empty_like(self._bgr)
+        self._small_rgb = np.empty((INFERENCE_SIZE[1], INFERENCE_SIZE[0], 3), dtype=np.uint8)
+        self._small_gray = np.empty((INFERENCE_SIZE[1], INFERENCE_SIZE[0]), dtype=np.uint8)
+        self._gate_gray = np.empty((GATE_SIZE[1], GATE_SIZE[0]), dtype=np.uint8)
+        # Thumbnail of the last frame pose inference ran on, and what it returned
+        self._inferred_gray = np.empty_like(self._gate_gray)
+        self._last_results = None
+        self._frame_idx = 0
+        self._display_rgb = (np.empty((display_size[1], display_size[0], 3), dtype=np.uint8)
+                             if display_size is not None else None)
+        self._display_bgrx = (np.empty((display_size[1], display_size[0], 4), dtype=np.uint8)
+                              if display_size is not None else None)
 
         # Try to import mediapipe
         try:
             import mediapipe as mp
             self.mp_pose = mp.solutions.pose
-            self.pose = self.mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+            # Lite model: the posture checks only use coarse shoulder/hip thresholds
+            self.pose = self.mp_pose.Pose(static_image_mode=False, model_complexity=0, smooth_landmarks=True,
+                                          enable_segmentation=False, min_detection_confidence=0.5,
+                                          min_tracking_confidence=0.5)
             self.mp_drawing = mp.solutions.drawing_utils
+            # Built once; same look as draw_landmarks' defaults
+            self._pose_connections = self.mp_pose.POSE_CONNECTIONS
+            self._landmark_spec = self.mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=2)
+            self._connection_spec = self.mp_drawing.DrawingSpec(color=(224, 224, 224), thickness=2)
             self.mediapipe_available = True
         except ImportError as e:
             msg = f"MediaPipe import error: {e}\nPosture detection will be limited. Please install mediapipe with 'pip install mediapipe'."
@@ -32,20 +110,50 @@ class PostureDetector:
             print(msg)
             print("Running in fallback mode without pose detection")
 
+        # Landmark coordinates are copied into these each frame instead of new arrays
+        self._lx = np.zeros(33, dtype=np.float64)
+        self._ly = np.zeros(33, dtype=np.float64)
+        if njit is not None:
+            # Compile now so the first real frame doesn't pay for it
+            _posture_kernel(self._lx, self._ly)
+
+        # The first pose.process call builds the MediaPipe graph (seconds); do it off the frame loop
+        self._pose_ready = threading.Event()
+        self._warmup_thread = None
+        if self.mediapipe_available:
+            self._warmup_thread = threading.Thread(target=self._warm_up_pose, daemon=True)
+            self._warmup_thread.start()
+
         # Fallback mode parameters
         self.motion_threshold = MOTION_THRESHOLD
         self.prev_frame = None
+        self._gray_bufs = [np.empty((FRAME_SIZE[1], FRAME_SIZE[0]), dtype=np.uint8) for _ in range(2)]
+        self._gray_idx = 0
+        self._gray_diff = np.empty_like(self._gray_bufs[0])
         self.movement_buffer = deque(maxlen=POSTURE_BUFFER_SIZE)
 
+    def _warm_up_pose(self):
+        try:
+            self.pose.process(np.zeros((INFERENCE_SIZE[1], INFERENCE_SIZE[0], 3), dtype=np.uint8))
+        except Exception as e:
+            print(f"Pose warm-up error: {e}")
+        self._pose_ready.set()
+
     def _show_error_dialog(self, title, message):
         try:
+            # QtWidgets is only needed for this dialog; headless users never load it
+            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(None, title, message)
         except Exception as e:
             print(f"[Dialog Error] {title}: {message} (QMessageBox failed: {e})")
 
     def initialize_camera(self):
         try:
-            self.cap = cv2.VideoCapture(0)
+            # DirectShow honours the MJPG/buffer settings below and opens faster than MSMF
+            if sys.platform == "win32":
+                self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+            else:
+                self.cap = cv2.VideoCapture(0)
             if not self.cap.isOpened():
                 msg = ("Error: Could not open camera.\n" 
                        "Possible reasons: camera not connected, in use by another app, or driver issue.\n"
@@ -54,6 +162,15 @@ class PostureDetector:
                     self._show_error_dialog("Camera Initialization Failed", msg)
                 print(msg)
                 return False
+            # Keep one buffered frame (no stale latency) and ask for compressed frames at the working size
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, FRAME_SIZE[0])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, FRAME_SIZE[1])
+            self.cap.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+            self._stop_capture.clear()
+            self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._capture_thread.start()
             return True
         except Exception as e:
             msg = f"Camera initialization error: {e}\nTry checking your camera connection or drivers."
@@ -62,15 +179,44 @@ class PostureDetector:
             print(msg)
             return False
 
+    def _capture_loop(self):
+        """Read frames so decoding overlaps pose inference; stale frames are dropped"""
+        while not self._stop_capture.is_set():
+            ret, frame = self.cap.read()
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put(frame if ret else None)
+            if not ret:
+                self._stop_capture.wait(0.05)
+
+    def _process_if_changed(self, small_rgb):
+        """Run pose inference, or reuse the last result on in-between frames and when the scene hasn't changed"""
+        self._frame_idx += 1
+        if self._last_results is not None and self._frame_idx % POSE_INFERENCE_STRIDE:
+            return self._last_results
+        gray = cv2.cvtColor(small_rgb, cv2.COLOR_RGB2GRAY, dst=self._small_gray)
+        gate = cv2.resize(gray, GATE_SIZE, dst=self._gate_gray, interpolation=cv2.INTER_AREA)
+        if (self._last_results is not None
+                and cv2.absdiff(gate, self._inferred_gray).mean() < STATIC_FRAME_THRESHOLD):
+            return self._last_results
+        # Compared against the last inferred frame, not the previous one, so slow drift still triggers
+        np.copyto(self._inferred_gray, gate)
+        self._last_results = self.pose.process(small_rgb)
+        return self._last_results
+
     def calculate_movement(self, frame):
         """Fallback method: Detect movement to estimate posture changes"""
+        # Ping-pong between two preallocated grayscale buffers instead of allocating per frame
+        current_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_bufs[self._gray_idx])
+        self._gray_idx ^= 1
         if self.prev_frame is None:
-            self.prev_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            self.prev_frame = current_frame
             return 0
 
-        current_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        frame_diff = cv2.absdiff(self.prev_frame, current_frame)
-        movement = np.mean(frame_diff)
+        frame_diff = cv2.absdiff(self.prev_frame, current_frame, dst=self._gray_diff)
+        movement = cv2.mean(frame_diff)[0]
 
         self.prev_frame = current_frame
         return movement
@@ -81,36 +227,48 @@ class PostureDetector:
             return None, "Camera not initialized", None, None, None
 
         try:
-            ret, frame = self.cap.read()
-            if not ret:
+            try:
+                frame = self._frame_q.get(timeout=CAPTURE_TIMEOUT)
+            except queue.Empty:
+                frame = None
+            if frame is None:
                 print("Failed to capture frame from camera.")
                 return None, "Failed to capture frame", None, None, None
 
-            # Resize frame
-            frame = cv2.resize(frame, (640, 480))
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Resize frame only if the driver ignored the requested size
+            if (frame.shape[1], frame.shape[0]) != FRAME_SIZE:
+                frame = cv2.resize(frame, FRAME_SIZE, dst=self._bgr, interpolation=cv2.INTER_AREA)
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
 
             back_angle = None
             forward_lean = None
             shoulder_diff = None
-            qt_pixmap = None  # Always assign default
+            qt_image = None  # Always assign default
+
+            if self.mediapipe_available and not self._pose_ready.is_set():
+                # Still warming up; show the camera feed but keep it out of the posture buffer
+                if not self.headless:
+                    qt_image = self._to_image(frame_rgb)
+                return qt_image, "Initializing pose detection...", None, None, None
 
             if self.mediapipe_available:
                 try:
-                    # MediaPipe pose detection
-                    results = self.pose.process(frame_rgb)
+                    # MediaPipe pose detection on a downscaled copy; landmarks come back
+                    # normalized, so they still line up with the full-size frame
+                    small_rgb = cv2.resize(frame_rgb, INFERENCE_SIZE, dst=self._small_rgb, interpolation=cv2.INTER_AREA)
+                    results = self._process_if_changed(small_rgb)
                     if results.pose_landmarks:
                         if not self.headless:
                             self.mp_drawing.draw_landmarks(
                                 frame_rgb,
                                 results.pose_landmarks,
-                                self.mp_pose.POSE_CONNECTIONS
+                                self._pose_connections,
+                                self._landmark_spec,
+                                self._connection_spec
                             )
                             feedback, back_angle, forward_lean, shoulder_diff = self.analyze_pose(results.pose_landmarks.landmark)
-                            # Create pixmap from annotated frame
-                            h, w, ch = frame_rgb.shape
-                            qt_image = QImage(frame_rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
-                            qt_pixmap = QPixmap.fromImage(qt_image)
+                            # Create image from annotated frame
+                            qt_image = self._to_image(frame_rgb)
                         else:
                             feedback = "No pose detected"
                     else:
@@ -131,65 +289,84 @@ class PostureDetector:
 
                 if not self.headless:
                     try:
-                        h, w, ch = frame_rgb.shape
-                        qt_image = QImage(frame_rgb.data, w, h, ch * w, QImage.Format.Format_RGB888)
-                        qt_pixmap = QPixmap.fromImage(qt_image)  # Convert QImage to QPixmap
+                        qt_image = self._to_image(frame_rgb)
                     except Exception as e:
-                        print(f"QPixmap/QImage creation error: {e}")
-                        qt_pixmap = None
+                        print(f"QImage creation error: {e}")
+                        qt_image = None
                 else:
-                    qt_pixmap = None
+                    qt_image = None
 
             self.current_feedback = feedback
-            self.posture_buffer.append(feedback)
+            self._push_feedback(feedback)
 
-            return qt_pixmap, feedback, back_angle, forward_lean, shoulder_diff
+            return qt_image, feedback, back_angle, forward_lean, shoulder_diff
         except Exception as e:
             print(f"General error in get_frame: {e}")
             return None, f"Frame processing error: {e}", None, None, None
 
+    def _to_image(self, frame_rgb):
+        """Scale an RGB frame to the display size and wrap it in a QImage.
+
+        The image is handed over as 32-bit BGRX (Format_RGB32), the layout QPixmap stores
+        natively, so QPixmap.fromImage on the GUI thread needs no per-pixel conversion.
+        QPixmap must only be created on the GUI thread, so the caller converts it there;
+        copy() detaches the image from the reused numpy buffer first.
+        """
+        if self.display_size is not None:
+            frame_rgb = cv2.resize(frame_rgb, self.display_size, dst=self._display_rgb)
+            frame_bgrx = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGRA, dst=self._display_bgrx)
+        else:
+            frame_bgrx = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGRA)
+        h, w, ch = frame_bgrx.shape
+        return QImage(frame_bgrx.data, w, h, ch * w, QImage.Format.Format_RGB32).copy()
+
     def analyze_pose(self, landmarks):
         """Analyze pose landmarks and return feedback"""
         try:
-            # Extract key points
-            left_shoulder = [landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER.value].x,
-                           landmarks[self.mp_pose.PoseLandmark.LEFT_SHOULDER.value].y]
-            right_shoulder = [landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER.value].x,
-                            landmarks[self.mp_pose.PoseLandmark.RIGHT_SHOULDER.value].y]
-            left_hip = [landmarks[self.mp_pose.PoseLandmark.LEFT_HIP.value].x,
-                       landmarks[self.mp_pose.PoseLandmark.LEFT_HIP.value].y]
-
-            # Calculate metrics
-            shoulder_diff = abs(left_shoulder[1] - right_shoulder[1])
-            forward_lean = abs(left_shoulder[0] - left_hip[0])
-            back_angle = np.arctan2(left_shoulder[1] - left_hip[1], left_shoulder[0] - left_hip[0]) * 180 / np.pi
-
-            # Analyze posture
-            issues = []
-            if shoulder_diff > 0.05:
-                issues.append("Uneven shoulders")
-            if forward_lean > 0.1:
-                issues.append("Forward lean")
-
-            feedback = "Bad posture: " + ", ".join(issues) if issues else "Good posture"
+            lx, ly = self._lx, self._ly
+            for i in POSTURE_LANDMARKS:
+                lm = landmarks[i]
+                lx[i] = lm.x
+                ly[i] = lm.y
+            shoulder_diff, forward_lean, back_angle = _posture_kernel(lx, ly)
+            feedback = _posture_feedback(shoulder_diff, forward_lean)
             return feedback, back_angle, forward_lean, shoulder_diff
 
         except Exception as e:
             print(f"Pose analysis error: {e}")
             return "Pose analysis error", None, None, None
 
+    def _push_feedback(self, feedback):
+        """Append to posture_buffer and keep the counts in step with what the deque evicts"""
+        if len(self.posture_buffer) == self.posture_buffer.maxlen:
+            oldest = self.posture_buffer[0]
+            self._posture_counts[oldest] -= 1
+            if not self._posture_counts[oldest]:
+                del self._posture_counts[oldest]
+        self.posture_buffer.append(feedback)
+        self._posture_counts[feedback] += 1
+
     def get_aggregated_posture(self):
-        """Calculate the most common posture status from the buffer"""
-        if len(self.posture_buffer) > 0:
-            try:
-                return mode(self.posture_buffer)
-            except:
-                return list(self.posture_buffer)[-1]
+        """Return the most common posture status in the buffer"""
+        if self._posture_counts:
+            return self._posture_counts.most_common(1)[0][0]
         return "No posture data"
 
     def release(self):
         """Clean up resources. Always call this on app exit or error to avoid camera/memory leaks."""
-        if self.cap is not None and self.cap.isOpened():
+        self._stop_capture.set()
+        if self._warmup_thread is not None:
+            self._warmup_thread.join()
+            self._warmup_thread = None
+        capture_stalled = False
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=CAPTURE_TIMEOUT)
+            # Still inside cap.read(); OpenCV can't release a capture another thread is reading
+            capture_stalled = self._capture_thread.is_alive()
+            self._capture_thread = None
+        if capture_stalled:
+            print("[PostureDetector] Camera read did not return; leaving the camera open.")
+        elif self.cap is not None and self.cap.isOpened():
             self.cap.release()
             print("[PostureDetector] Camera released.")
         if self.mediapipe_available:
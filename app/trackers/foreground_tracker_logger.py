@@ -2,6 +2,7 @@ import time
 import csv
 from datetime import datetime
 import os
+import threading
 
 try:
     import pygetwindow as gw
@@ -34,7 +35,9 @@ def get_foreground_app():
         return title, exe
     return None, None
 
-def main():
+def main(stop_event=None):
+    # stop_event lets an in-process caller end the loop; from the console, Ctrl+C does
+    stop_event = stop_event or threading.Event()
     log_file = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../foreground_app_log.csv'))
     print(f"Logging foreground apps to {log_file}. Press Ctrl+C to stop.")
     header = ["timestamp", "window_title", "process_name"]
@@ -44,7 +47,7 @@ def main():
         if f.tell() == 0:
             writer.writerow(header)
         try:
-            while True:
+            while not stop_event.is_set():
                 title, exe = get_foreground_app()
                 now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 if (title, exe) != last:
@@ -52,7 +55,7 @@ def main():
                     writer.writerow([now, title, exe])
                     f.flush()
                     last = (title, exe)
-                time.sleep(2)
+                stop_event.wait(2)
         except KeyboardInterrupt:
             print("Stopped foreground app logging.")
 
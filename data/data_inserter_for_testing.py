@@ -1,7 +1,10 @@
 import sqlite3
 import random
 from datetime import datetime, timedelta
-import csv
+import pandas as pd
+
+EXPORT_COLUMNS = ["ID", "Timestamp", "Action", "Posture Status", "Back Angle", "Water Intake", "Break Taken", "Activity", "Forward Lean", "Shoulder Alignment", "Session Status", "Game"]
+EXPORT_CHUNK_SIZE = 50_000
 
 def generate_random_data(num_entries):
     actions = ['Aggregated Posture: Slouching', 'Aggregated Posture: Good Posture', 'Aggregated Posture: Forward Head Posture']
@@ -37,15 +40,13 @@ def insert_test_data(num_entries=1000):
                      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', additional_data)
     conn.commit()
 
-    # Export data to CSV
-    c.execute("SELECT * FROM detailed_logs")
-    rows = c.fetchall()
-    conn.close()
-
+    # Export data to CSV; pandas serialises each chunk in C and large tables are never fully in memory
     with open("detailed_health_logs.csv", "w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(["ID", "Timestamp", "Action", "Posture Status", "Back Angle", "Water Intake", "Break Taken", "Activity", "Forward Lean", "Shoulder Alignment", "Session Status", "Game"])
-        writer.writerows(rows)
+        # Header first, so an empty table still exports a CSV read_csv can load
+        pd.DataFrame(columns=EXPORT_COLUMNS).to_csv(file, index=False)
+        for chunk in pd.read_sql_query("SELECT * FROM detailed_logs", conn, chunksize=EXPORT_CHUNK_SIZE):
+            chunk.to_csv(file, index=False, header=False)
+    conn.close()
 
 if __name__ == "__main__":
     insert_test_data(1000)
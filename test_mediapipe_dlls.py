@@ -3,6 +3,31 @@ import sys
 import ctypes
 import traceback
 
+# Resolve each DLL's dependencies from its own folder instead of the cwd/PATH
+LOAD_WITH_ALTERED_SEARCH_PATH = 0x00000008
+
+if os.name == "nt":
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.LoadLibraryExW.restype = ctypes.c_void_p
+    kernel32.LoadLibraryExW.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p, ctypes.c_uint32]
+
+def load_dll(path):
+    if os.name != "nt":
+        return ctypes.CDLL(path)
+    handle = kernel32.LoadLibraryExW(path, None, LOAD_WITH_ALTERED_SEARCH_PATH)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    return handle
+
+def find_dlls(root):
+    """Yield .dll paths under root; scandir entries carry their type, so no extra stat per file"""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from find_dlls(entry.path)
+            elif entry.name.lower().endswith(".dll"):
+                yield entry.path
+
 print("Python EXE:", sys.executable)
 print("sys.path:", sys.path)
 print("PATH:", os.environ.get("PATH"))
@@ -17,14 +42,11 @@ except Exception as e:
     traceback.print_exc()
     # Try to find the DLL manually
     mp_dir = os.path.dirname(mediapipe.__file__)
-    for root, dirs, files in os.walk(mp_dir):
-        for file in files:
-            if file.endswith(".dll"):
-                dll_path = os.path.join(root, file)
-                print("Trying to load DLL:", dll_path)
-                try:
-                    ctypes.CDLL(dll_path)
-                    print("Loaded:", dll_path)
-                except Exception as dll_e:
-                    print("Failed to load:", dll_path)
-                    print(dll_e) 
\ No newline at end of file
+    for dll_path in find_dlls(mp_dir):
+        print("Trying to load DLL:", dll_path)
+        try:
+            load_dll(dll_path)
+            print("Loaded:", dll_path)
+        except Exception as dll_e:
+            print("Failed to load:", dll_path)
+            print(dll_e)
@@ -0,0 +1,33 @@
+"""
+Shared SQLite connection for the test and check scripts.
+"""
+
+import atexit
+import functools
+import os
+import sqlite3
+
+# Same override as main3: HT_DB_PATH='file:ht_test?mode=memory&cache=shared' keeps the whole run in RAM
+DB_PATH = os.environ.get('HT_DB_PATH', 'health_tracker.db')
+
+def tune(conn):
+    """Apply the benchmark PRAGMAs: WAL, fewer fsyncs, in-memory temp tables, 64 MB cache, 256 MB mmap"""
+    conn.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+    ''')
+    return conn
+
+@functools.lru_cache(maxsize=1)
+def get_conn():
+    """Return the one connection used for a whole run (autocommit; wrap batches in BEGIN/COMMIT).
+
+    WAL with synchronous=NORMAL means a commit no longer waits on an fsync of the main database.
+    Don't close it - later tests reuse it; it is closed when the interpreter exits.
+    """
+    conn = tune(sqlite3.connect(DB_PATH, uri=True, isolation_level=None, check_same_thread=False, cached_statements=256))
+    atexit.register(conn.close)
+    return conn
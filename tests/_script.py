@@ -0,0 +1,12 @@
+"""
+Shared helper for the script-style tests, which report failure by returning False.
+"""
+
+import functools
+
+def script_test(func):
+    """Turn a False return into an AssertionError, so pytest and the script runners both see it"""
+    @functools.wraps(func)
+    def wrapper():
+        assert func() is not False, f"{func.__name__} reported failure"
+    return wrapper
@@ -3,34 +3,32 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../app')))
 
-import sqlite3
 import time
 from datetime import datetime
 from main3 import setup_database
+from _db import get_conn
 
 setup_database()  # Ensure DB is initialized before checking
 
 def check_database():
     try:
-        conn = sqlite3.connect('health_tracker.db')
-        c = conn.cursor()
+        c = get_conn().cursor()
         
         # Check total entries
         c.execute('SELECT COUNT(*) FROM detailed_logs')
         total_entries = c.fetchone()[0]
         print(f"📊 Total log entries: {total_entries}")
         
-        # Check recent entries
-        c.execute('SELECT timestamp, action FROM detailed_logs ORDER BY timestamp DESC LIMIT 5')
+        # Check recent entries (served newest-first by the idx_logs_ts index)
+        c.execute('SELECT timestamp, session_status, game FROM detailed_logs ORDER BY timestamp DESC LIMIT 5')
         recent_entries = c.fetchall()
         
         print("\n🕒 Recent entries:")
-        for i, (timestamp, action) in enumerate(recent_entries, 1):
-            print(f"  {i}. {timestamp} - {action}")
+        for i, (timestamp, session_status, game) in enumerate(recent_entries, 1):
+            print(f"  {i}. {timestamp} - {session_status or 'Posture'} ({game or 'Unknown app'})")
         
         # Check if application is actively logging
-        c.execute('SELECT timestamp FROM detailed_logs ORDER BY timestamp DESC LIMIT 1')
-        latest_entry = c.fetchone()
+        latest_entry = recent_entries[0] if recent_entries else None
         
         if latest_entry:
             latest_time = datetime.strptime(latest_entry[0], '%Y-%m-%d %H:%M:%S')
@@ -45,7 +43,6 @@ def check_database():
             else:
                 print("⚠️  No recent activity detected")
         
-        conn.close()
         return True
         
     except Exception as e:
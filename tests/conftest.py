@@ -0,0 +1,65 @@
+"""
+pytest glue for the script-style tests, so they can also run in parallel:
+
+    pytest -n auto --dist loadgroup tests/
+
+The scripts still run on their own with `python tests/<script>.py`.
+Under pytest each worker uses its own temporary database instead of health_tracker.db
+unless HT_DB_PATH is set.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../app')))
+
+# Interactive helpers that wait for Ctrl+C; only meant to be run by hand
+collect_ignore = ["test_foreground_tracker.py", "test_foreground_tracker_logger.py"]
+
+# Tests that write to health_tracker.db and depend on each other's rows; xdist keeps a group
+# on one worker, in file order
+DATABASE_TESTS = {
+    "test_database_integration",
+    "test_logging_functions",
+    "test_ist_timestamp_logging",
+    "test_data_validation",
+    "test_database_performance",
+    "test_database_setup",
+}
+
+# Tests that read the foreground window; skipped where there is none to read
+FOREGROUND_WINDOW_TESTS = {"test_game_detection"}
+
+def _foreground_window_unavailable():
+    """Reason get_foreground_app() can only return (None, None) here, or None if it can work"""
+    import main3
+    if main3.win32gui is None and main3.gw is None:
+        return "no foreground-window backend (pywin32 or pygetwindow) installed"
+    if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        return "no display available"
+    return None
+
+def pytest_collection_modifyitems(items):
+    no_window = _foreground_window_unavailable()
+    for item in items:
+        if item.name in DATABASE_TESTS:
+            item.add_marker(pytest.mark.xdist_group("database"))
+        if no_window and item.name in FOREGROUND_WINDOW_TESTS:
+            item.add_marker(pytest.mark.skip(reason=no_window))
+
+@pytest.fixture(scope="session", autouse=True)
+def test_db(tmp_path_factory):
+    """Point main3 and _db at a per-worker database, create the tables and open the shared connection"""
+    import main3
+    import _db
+    if "HT_DB_PATH" not in os.environ:
+        # Set before the first connection; both modules read DB_PATH when they connect.
+        # PYTEST_XDIST_WORKER is unset without xdist.
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        main3.DB_PATH = _db.DB_PATH = str(tmp_path_factory.mktemp(f"db_{worker_id}") / "health_tracker.db")
+    main3.setup_database()
+    _db.get_conn()
+    yield _db.DB_PATH
+    main3.close_log_connection()
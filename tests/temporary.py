@@ -3,35 +3,82 @@ import sys
 import time
 import threading
 import sqlite3
-from sqlite3 import connect
 from threading import Lock
 import csv
 import random
+import itertools
 import os
+from collections import deque
 from PyQt6.QtWidgets import QApplication,QGridLayout, QMainWindow, QLabel, QPushButton, QVBoxLayout, QWidget, QListWidget, QFileDialog, QMessageBox, QDialog, QLineEdit, QHBoxLayout, QProgressBar
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QObject, QRunnable, QThreadPool
 from posture_detection import PostureDetector
 from datetime import datetime
 import psutil
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 db_lock=Lock()
+DB_PATH = "health_tracker.db"
+# Opened once by setup_database(): writes go through DB_CONN under db_lock; the UI and
+# reminder reads use DB_READ, which in WAL mode never waits on a writer
+DB_CONN = None
+DB_READ = None
+# Write statements; sqlite3 caches the compiled statement per connection, keyed on this text
+INSERT_LOG_SQL = '''INSERT INTO detailed_logs (timestamp, action, posture_status, back_angle, water_intake, break_taken, activity, forward_lean, shoulder_alignment, session_status, game)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+ADD_POINTS_SQL = "UPDATE user_points SET points = points + ? WHERE id = 1"
+SAVE_SETTINGS_SQL = "UPDATE user_settings SET hydration_interval = ?, break_interval = ? WHERE id = 1"
+
+# Log rows and points waiting for the next flush_logs(); written together in one transaction
+PENDING_LOGS = deque()
+PENDING_POINTS = 0
+# How often the UI flushes pending log rows (milliseconds)
+FLUSH_INTERVAL_MS = 2000
+
+def _open_db(read_only=False):
+    # Autocommit (explicit BEGIN where needed); PRAGMAs other than journal_mode are per-connection
+    if read_only:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, isolation_level=None, check_same_thread=False, cached_statements=256)
+    else:
+        conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False, cached_statements=256)
+    conn.executescript('''
+        PRAGMA busy_timeout=5000;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+    ''')
+    return conn
+
 # Database setup
-GAME_PROCESSES = ["whatsapp.exe", "valorant.exe", "leagueclient.exe", "csgo.exe", "solitaire.exe"]
+GAME_PROCESSES = frozenset(["whatsapp.exe", "valorant.exe", "leagueclient.exe", "csgo.exe", "solitaire.exe"])
+# Seconds a process scan result is reused; the UI timer and reminder thread both poll it
+GAME_CHECK_TTL = 3.0
+_game_check = (0.0, (False, None))  # (expires at, result)
 
+# Detect active game process
 def is_game_running():
-    for process in psutil.process_iter(['name']):
-        try:
-            if process.info['name'] and process.info['name'].lower() in GAME_PROCESSES:
-                return True, process.info['name']
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
-    return False, None
+    global _game_check
+    expires, result = _game_check
+    now = time.monotonic()
+    if now < expires:
+        return result
+    result = (False, None)
+    # attrs= makes psutil skip vanished processes and fill ad_value on AccessDenied internally
+    for process in psutil.process_iter(attrs=['name'], ad_value=None):
+        name = process.info['name']
+        if name and name.lower() in GAME_PROCESSES:
+            result = (True, name)
+            break
+    _game_check = (now + GAME_CHECK_TTL, result)
+    return result
 
 def setup_database():
-    conn = sqlite3.connect("health_tracker.db")
+    global DB_CONN, DB_READ
+    conn = DB_CONN = _open_db()
+    # WAL is stored in the database file, so it only needs setting once
+    conn.execute("PRAGMA journal_mode=WAL")
     c = conn.cursor()
     c.execute('''CREATE TABLE IF NOT EXISTS health_logs (
                     id INTEGER PRIMARY KEY,
@@ -57,43 +104,60 @@ def setup_database():
                     shoulder_alignment REAL,
                     session_status TEXT,
                     game TEXT)''')
+    c.execute("CREATE INDEX IF NOT EXISTS idx_health_logs_action ON health_logs(action, id)")
     c.execute('''INSERT OR IGNORE INTO user_settings (id, hydration_interval, break_interval)
                  VALUES (1, 15, 30)''')  # Default settings
     c.execute('''INSERT OR IGNORE INTO user_points (id, points)
                  VALUES (1, 0)''')  # Default points
-    conn.commit()
-    conn.close()
-    db_lock=Lock()
-# Insert log into database
+    DB_READ = _open_db(read_only=True)
+# Queue a log row; flush_logs() writes it
 def log_action(action, posture_status=None, back_angle=None, water_intake=None, break_taken=None, activity=None, forward_lean=None, shoulder_alignment=None, session_status=None, game=None):
-    with db_lock:
-        with connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            c.execute('''INSERT INTO detailed_logs (timestamp, action, posture_status, back_angle, water_intake, break_taken, activity, forward_lean, shoulder_alignment, session_status, game)
-                         VALUES (datetime('now'), ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                      (action, posture_status, back_angle, water_intake, break_taken, activity, forward_lean, shoulder_alignment, session_status, game))    
-    conn.commit()
-    conn.close()
-# Add points for completing reminders
+    # Same UTC format SQLite's datetime('now') produced when rows were written immediately
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+    PENDING_LOGS.append((timestamp, action, posture_status, back_angle, water_intake, break_taken, activity, forward_lean, shoulder_alignment, session_status, game))
+
+# Add points for completing reminders; written with the next flush_logs()
 def add_points(points):
-    conn = sqlite3.connect("health_tracker.db")
-    c = conn.cursor()
-    c.execute("UPDATE user_points SET points = points + ? WHERE id = 1", (points,))
-    conn.commit()
-    conn.close()
+    global PENDING_POINTS
+    with db_lock:
+        PENDING_POINTS += points
 
-# Detect active game process
-def is_game_running():
-    game_name = None
-    for process in psutil.process_iter(['name']):
+# Queue a reminder row and its points together so the same flush_logs() writes both
+def log_and_award(action, points, **fields):
+    global PENDING_POINTS
+    with db_lock:
+        log_action(action, **fields)
+        PENDING_POINTS += points
+
+# Write all queued log rows and points in one transaction
+def flush_logs():
+    global PENDING_POINTS
+    with db_lock:
+        rows = [PENDING_LOGS.popleft() for _ in range(len(PENDING_LOGS))]
+        if not rows and not PENDING_POINTS:
+            return
         try:
-            if process.info['name'] and process.info['name'].lower() in [
-                'whatsapp.exe', 'valorant.exe', 'leagueclient.exe', 'csgo.exe', 'solitaire.exe']:
-                game_name = process.info['name']
-                return True, game_name
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
-    return False, game_name
+            DB_CONN.execute("BEGIN IMMEDIATE")
+            DB_CONN.executemany(INSERT_LOG_SQL, rows)
+            if PENDING_POINTS:
+                DB_CONN.execute(ADD_POINTS_SQL, (PENDING_POINTS,))
+            DB_CONN.execute("COMMIT")
+        except sqlite3.Error:
+            # BEGIN itself may have failed (database locked), leaving nothing to roll back
+            if DB_CONN.in_transaction:
+                DB_CONN.execute("ROLLBACK")
+            # Requeue in their original order; PENDING_POINTS is only cleared on commit
+            PENDING_LOGS.extendleft(reversed(rows))
+            raise
+        PENDING_POINTS = 0
+
+# Timer and reminder-thread flush: an exception would abort the Qt app or end the reminder
+# loop, so report it and leave the rows queued for the next tick
+def try_flush_logs():
+    try:
+        flush_logs()
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
 
 # Health Tips
 HEALTH_TIPS = [
@@ -103,8 +167,63 @@ HEALTH_TIPS = [
     "Avoid looking at the screen for long periods.",
     "Maintain a proper sitting posture."
 ]
+HYDRATION_MSG = "{}\nTake a sip of water!"
+BREAK_MSG = "{}\nTake a 5-minute break!"
+
+# Automatic CSV export cadence (milliseconds) and write buffer size (bytes)
+EXPORT_INTERVAL_MS = 5 * 60 * 1000
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Pause before retrying after get_frame() fails (milliseconds)
+FRAME_RETRY_MS = 100
+
+# Reads frames off the GUI thread; get_frame() blocks until the camera delivers one, so
+# the UI only wakes when there is a new frame to show
+class FrameWorker(QThread):
+    frame_ready = pyqtSignal(QImage, str, object, object, object)
+
+    def __init__(self, posture_detector):
+        super().__init__()
+        self.posture_detector = posture_detector
+        self.running = True
+
+    def run(self):
+        while self.running:
+            frame, feedback, back_angle, forward_lean, shoulder_diff = self.posture_detector.get_frame()
+            if frame is not None:
+                self.frame_ready.emit(frame, feedback, back_angle, forward_lean, shoulder_diff)
+            else:
+                self.msleep(FRAME_RETRY_MS)
+
+    def stop(self):
+        self.running = False
+        self.wait()
+
+class ProbeSignals(QObject):
+    # (running game's name or None, newest health_logs rows as (id, timestamp, action))
+    finished = pyqtSignal(object, list)
+
+# Runs the game-process scan and the recent-logs query on a QThreadPool thread so the
+# 1 s session tick never blocks the GUI thread
+class StatusProbe(QRunnable):
+    def __init__(self, conn, signals):
+        super().__init__()
+        self.conn = conn
+        self.signals = signals
+
+    def run(self):
+        game_running, game_name = is_game_running()
+        try:
+            rows = self.conn.execute("SELECT id, timestamp, action FROM health_logs ORDER BY id DESC LIMIT 8").fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            rows = []
+        self.signals.finished.emit(game_name if game_running else None, rows)
 
 class Overlay(QMainWindow):
+    # Emitted from the reminder thread; Qt queues it onto the GUI thread, which owns the widgets
+    reminder_due = pyqtSignal(str, str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Health Tracker")
@@ -362,23 +481,49 @@ class Overlay(QMainWindow):
 
         self.running = False
         self.start_time = None
+        # Newest health_logs id shown in log_list
+        self.logs_last_id = None
+        # Highest detailed_logs id in the last export
+        self.exported_id = None
         
         # Apply initial styles
         self.apply_styles()
 
-        # Initialize PostureDetector
+        self.reminder_due.connect(self.show_reminder)
+
+        # Session timer; started and stopped with the session
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_timer_label)
+        # Background status checks: one in flight at a time, each with the probe's own connection
+        self.probe_conn = _open_db(read_only=True)
+        self.probe_signals = ProbeSignals()
+        self.probe_signals.finished.connect(self.update_status)
+        self.probe_pending = False
+
+        # Write queued log rows in batches
+        self.flush_timer = QTimer()
+        self.flush_timer.timeout.connect(try_flush_logs)
+        self.flush_timer.start(FLUSH_INTERVAL_MS)
+
+        # Initialize PostureDetector; without a camera there is no frame worker to stop later
+        self.frame_worker = None
         self.posture_detector = PostureDetector()
         if not self.posture_detector.initialize_camera():
             QMessageBox.critical(self, "Error", "Could not initialize camera")
             return
 
         # Start video update
-        self.update_video()
+        self.frame_worker = FrameWorker(self.posture_detector)
+        self.frame_worker.frame_ready.connect(self.update_video)
+        self.frame_worker.start()
 
         # Set up a timer to export logs every 5 minutes
         self.export_timer = QTimer()
-        self.export_timer.timeout.connect(self.export_logs)
-        self.export_timer.start(1 * 60 * 1000)  # 5 minutes in milliseconds
+        self.export_timer.timeout.connect(self.auto_export_logs)
+        self.export_timer.start(EXPORT_INTERVAL_MS)
+
+    def show_reminder(self, title, message):
+        QMessageBox.information(self, title, message)
 
     def apply_styles(self):
         if self.theme == "Light":
@@ -452,50 +597,52 @@ class Overlay(QMainWindow):
         if not self.running:
             self.running = True
             self.start_time = time.time()
-            threading.Thread(target=self.update_timer, daemon=True).start()
+            self.timer.start(1000)  # 1 second interval
             log_action("Session started", session_status="Started")
 
     def stop(self):
         if self.running:
             self.running = False
+            self.timer.stop()
+            if self.frame_worker is not None:
+                self.frame_worker.stop()
             self.posture_detector.release()
             log_action("Session stopped", session_status="Stopped")
 
-def update_timer(self):
-    self.timer = QTimer()
-    self.timer.timeout.connect(self.update_timer_label)
-    self.timer.start(1000)  # 1 second interval
-
-def update_timer_label(self):
-    if self.running:
-        elapsed = int(time.time() - self.start_time)
-        self.label.setText(f"Session Timer: {elapsed} seconds")
-        game_running, game_name = is_game_running()
+    def update_timer_label(self):
+        if self.running:
+            elapsed = int(time.time() - self.start_time)
+            self.label.setText(f"Session Timer: {elapsed} seconds")
+            # The process scan and log query run on the pool; update_status applies the result
+            if not self.probe_pending:
+                self.probe_pending = True
+                QThreadPool.globalInstance().start(StatusProbe(self.probe_conn, self.probe_signals))
+
+    def update_status(self, game_name, rows):
+        self.probe_pending = False
         self.game_status.setText(
-            f"Game Status: Running ({game_name})" if game_running else "Game Status: Not Running"
+            f"Game Status: Running ({game_name})" if game_name else "Game Status: Not Running"
         )
-        self.update_logs()
+        self.update_logs(rows)
 
-    def update_logs(self):
-        conn = sqlite3.connect("health_tracker.db")
-        c = conn.cursor()
-        c.execute("SELECT timestamp, action FROM health_logs ORDER BY id DESC LIMIT 8")
-        rows = c.fetchall()
-        conn.close()
+    def update_logs(self, rows):
+        # Same newest row as last tick: the list is already current
+        newest_id = rows[0][0] if rows else None
+        if newest_id == self.logs_last_id:
+            return
+        self.logs_last_id = newest_id
 
         self.log_list.clear()
-        for row in rows:
-            self.log_list.addItem(f"{row[0]} - {row[1]}")
+        self.log_list.addItems([f"{row[1]} - {row[2]}" for row in rows])
 
-    def update_video(self):
+    def update_video(self, frame, feedback, back_angle, forward_lean, shoulder_diff):
         current_time = time.time()
-        frame, feedback, back_angle, forward_lean, shoulder_diff = self.posture_detector.get_frame()
-        
         if frame is not None:
-            # Convert the frame (QImage) to QPixmap
-            pixmap = QPixmap.fromImage(frame)
-            self.video_label.setPixmap(pixmap)
-            self.video_label.setScaledContents(True)
+            # Scale the QImage to the label once, before converting, instead of having
+            # setScaledContents resample the full frame on every repaint
+            frame = frame.scaled(self.video_label.contentsRect().size(),
+                                 Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+            self.video_label.setPixmap(QPixmap.fromImage(frame))
             self.posture_feedback.setText(f"Posture Status: {feedback}")
             
             # Log aggregated data every 30 seconds
@@ -504,8 +651,6 @@ def update_timer_label(self):
                 game_running, game_name = is_game_running()
                 log_action(f"Aggregated Posture: {aggregated_posture}", posture_status=feedback, back_angle=back_angle, forward_lean=forward_lean, shoulder_alignment=shoulder_diff, session_status="Running", game=game_name)
                 self.last_log_time = current_time
-                
-        QTimer.singleShot(10, self.update_video)
 
     def open_settings(self):
         settings_dialog = QDialog(self)
@@ -532,31 +677,35 @@ def update_timer_label(self):
         settings_dialog.exec()
 
     def save_settings(self, hydration_interval, break_interval, dialog):
-        conn = sqlite3.connect("health_tracker.db")
-        c = conn.cursor()
-        c.execute("UPDATE user_settings SET hydration_interval = ?, break_interval = ? WHERE id = 1",
-                  (hydration_interval or 15, break_interval or 30))
-        conn.commit()
-        conn.close()
+        with db_lock:
+            DB_CONN.execute(SAVE_SETTINGS_SQL, (hydration_interval or 15, break_interval or 30))
         dialog.accept()
 
     def show_graph(self):
-        conn = sqlite3.connect("health_tracker.db")
-        c = conn.cursor()
-        c.execute("SELECT timestamp, action FROM health_logs")
-        data = c.fetchall()
-        conn.close()
+        # Only the reminder rows are plotted; idx_health_logs_action serves the filter
+        data = DB_READ.execute("""SELECT timestamp, action FROM health_logs
+                                  WHERE action IN ('Hydration reminder sent', 'Break reminder sent')
+                                  ORDER BY id""").fetchall()
 
-        timestamps = [datetime.strptime(row[0], "%Y-%m-%d %H:%M:%S") for row in data]
-        actions = [row[1] for row in data]
+        # fromisoformat takes SQLite's "YYYY-MM-DD HH:MM:SS" directly and skips strptime's format parsing
+        timestamps = [datetime.fromisoformat(row[0]) for row in data]
+        actions = np.array([row[1] for row in data], dtype=object)
 
+        # Running totals: one pass per series instead of a list.count() per row
         plt.figure(figsize=(10, 5))
-        plt.plot(timestamps, [actions.count("Hydration reminder sent") for _ in timestamps], label="Hydration")
-        plt.plot(timestamps, [actions.count("Break reminder sent") for _ in timestamps], label="Breaks")
+        plt.plot(timestamps, np.cumsum(actions == "Hydration reminder sent"), label="Hydration")
+        plt.plot(timestamps, np.cumsum(actions == "Break reminder sent"), label="Breaks")
         plt.legend()
         plt.show()
 
+    def auto_export_logs(self):
+        # Nothing new since the last export: skip rewriting the same history
+        if DB_READ.execute("SELECT MAX(id) FROM detailed_logs").fetchone()[0] != self.exported_id:
+            self.export_logs()
+
     def export_logs(self):
+        last_id = DB_READ.execute("SELECT MAX(id) FROM detailed_logs").fetchone()[0]
+
         # Create a directory for logs if it doesn't exist
         log_directory = "health_logs"
         if not os.path.exists(log_directory):
@@ -566,85 +715,72 @@ def update_timer_label(self):
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = os.path.join(log_directory, f"detailed_health_logs_{timestamp}.csv")
 
-        # Export logs to the file
-        conn = sqlite3.connect("health_tracker.db")
-        c = conn.cursor()
-        c.execute("SELECT * FROM detailed_logs")
-        rows = c.fetchall()
-        conn.close()
-
-        with open(filename, "w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(["ID", "Timestamp", "Action", "Posture Status", "Back Angle", "Water Intake", "Break Taken", "Activity", "Forward Lean", "Shoulder Alignment", "Session Status", "Game"])
-            writer.writerows(rows)
-
-        # Show a message box to confirm the export
-        QMessageBox.information(self, "Export Success", f"Logs exported as {filename}")
+        try:
+            # Stream rows from the cursor to the file instead of loading the whole table
+            with open(filename, "w", newline="", buffering=EXPORT_BUFFER_SIZE) as file:
+                writer = csv.writer(file)
+                writer.writerow(["ID", "Timestamp", "Action", "Posture Status", "Back Angle", "Water Intake", "Break Taken", "Activity", "Forward Lean", "Shoulder Alignment", "Session Status", "Game"])
+                writer.writerows(DB_READ.execute("SELECT * FROM detailed_logs WHERE id <= ? ORDER BY id", (last_id or 0,)))
+            self.exported_id = last_id
+
+            # Show a message box to confirm the export
+            QMessageBox.information(self, "Export Success", f"Logs exported as {filename}")
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export logs: {e}")
 
     def cleanup(self):
+        if self.frame_worker is not None:
+            self.frame_worker.stop()
         self.posture_detector.release()
+        flush_logs()
         self.close()
-def export_logs(self):
-    log_directory = "health_logs"
-    if not os.path.exists(log_directory):
-        os.makedirs(log_directory)
-
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    filename = os.path.join(log_directory, f"detailed_health_logs_{timestamp}.csv")
-
-    try:
-        with sqlite3.connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            c.execute("SELECT * FROM detailed_logs")
-            rows = c.fetchall()
-
-        with open(filename, "w", newline="") as file:
-            writer = csv.writer(file)
-            writer.writerow(["ID", "Timestamp", "Action", "Posture Status", "Back Angle", "Water Intake", "Break Taken", "Activity", "Forward Lean", "Shoulder Alignment", "Session Status", "Game"])
-            writer.writerows(rows)
-
-        QMessageBox.information(self, "Export Success", f"Logs exported as {filename}")
-    except Exception as e:
-        QMessageBox.critical(self, "Export Error", f"Failed to export logs: {e}")
 # Reminder thread function
-def reminder_thread(app):
-    conn = sqlite3.connect("health_tracker.db")
-    c = conn.cursor()
-    c.execute("SELECT hydration_interval, break_interval FROM user_settings WHERE id = 1")
-    hydration_interval, break_interval = c.fetchone()
-    conn.close()
+def reminder_thread(app, stop_event):
+    hydration_interval, break_interval = DB_READ.execute(
+        "SELECT hydration_interval, break_interval FROM user_settings WHERE id = 1").fetchone()
 
     hydration_interval *= 60
     break_interval *= 60
 
     last_hydration_reminder = time.time()
     last_break_reminder = time.time()
+    # Shuffled once, then cycled: every tip shows before any repeats
+    tips = itertools.cycle(random.sample(HEALTH_TIPS, len(HEALTH_TIPS)))
 
-    while True:
+    # Sleep until the next reminder is due instead of waking every second
+    while not stop_event.wait(max(0.0, min(last_hydration_reminder + hydration_interval,
+                                           last_break_reminder + break_interval) - time.time())):
         current_time = time.time()
         game_running, game_name = is_game_running()
         if game_running:
             if current_time - last_hydration_reminder >= hydration_interval:
-                QMessageBox.information(app, "Hydration Reminder", f"{random.choice(HEALTH_TIPS)}\nTake a sip of water!")
-                log_action("Hydration reminder sent", water_intake=1, game=game_name)
-                add_points(5)
+                app.reminder_due.emit("Hydration Reminder", HYDRATION_MSG.format(next(tips)))
+                log_and_award("Hydration reminder sent", 5, water_intake=1, game=game_name)
                 last_hydration_reminder = current_time
 
             if current_time - last_break_reminder >= break_interval:
-                QMessageBox.information(app, "Break Reminder", f"{random.choice(HEALTH_TIPS)}\nTake a 5-minute break!")
-                log_action("Break reminder sent", break_taken=1, game=game_name)
-                add_points(10)
+                app.reminder_due.emit("Break Reminder", BREAK_MSG.format(next(tips)))
+                log_and_award("Break reminder sent", 10, break_taken=1, game=game_name)
                 last_break_reminder = current_time
 
-        time.sleep(1)
+            try_flush_logs()
+        else:
+            # Due, but no game yet: check again when the process scan cache expires
+            stop_event.wait(GAME_CHECK_TTL)
 
 def main():
     setup_database()
     app = QApplication(sys.argv)
     main_window = Overlay()
     main_window.show()
-    threading.Thread(target=reminder_thread, args=(main_window,), daemon=True).start()
-    sys.exit(app.exec())
+    stop_reminders = threading.Event()
+    reminders = threading.Thread(target=reminder_thread, args=(main_window, stop_reminders), daemon=True)
+    reminders.start()
+    exit_code = app.exec()
+    stop_reminders.set()
+    reminders.join()
+    flush_logs()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,21 +1,35 @@
-import subprocess
 import sys
 import os
+import threading
 import time
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../app/trackers')))
+
+# How long to wait for the logger to write its first row (seconds)
+LOG_TIMEOUT = 10
+
 def test_foreground_tracker_logger():
-    script_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../app/trackers/foreground_tracker_logger.py'))
+    import foreground_tracker_logger
     log_file = os.path.abspath(os.path.join(os.path.dirname(__file__), '../foreground_app_log.csv'))
-    print(f"Running: {script_path}")
+    print(f"Running: {foreground_tracker_logger.__file__}")
     print(f"Log file: {log_file}")
     try:
-        proc = subprocess.Popen([sys.executable, script_path])
-        print("Switch between apps for 10 seconds. Then press Ctrl+C in the logger window to stop.")
-        time.sleep(10)
+        start_size = os.path.getsize(log_file) if os.path.exists(log_file) else 0
+        stop = threading.Event()
+        logger = threading.Thread(target=foreground_tracker_logger.main, args=(stop,), daemon=True)
+        logger.start()
+        # The logger writes a row as soon as it sees the first foreground window
+        deadline = time.monotonic() + LOG_TIMEOUT
+        while time.monotonic() < deadline and logger.is_alive():
+            if os.path.exists(log_file) and os.path.getsize(log_file) > start_size:
+                break
+            time.sleep(0.1)
+        stop.set()
+        logger.join()
         print("Check that foreground_app_log.csv contains the correct logs.")
         print("You can open the CSV file in Excel or a text editor.")
     except Exception as e:
         print(f"Error running foreground tracker logger: {e}")
 
 if __name__ == "__main__":
-    test_foreground_tracker_logger() 
\ No newline at end of file
+    test_foreground_tracker_logger()
\ No newline at end of file
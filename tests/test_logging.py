@@ -8,13 +8,19 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../app')))
 
+import contextlib
 import sqlite3
 import time
 from datetime import datetime
+import pandas as pd
 
 # Import from app
-from main3 import setup_database, log_action, log_posture_data
+import main3
+from main3 import setup_database, log_actions, log_posture_data, logging_transaction
+from _db import get_conn
+from _script import script_test
 
+@script_test
 def test_database_setup():
     """Test database setup and table creation"""
     print("Testing database setup...")
@@ -24,79 +30,103 @@ def test_database_setup():
     
     # Verify tables exist
     try:
-        with sqlite3.connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            
-            # Check if tables exist
-            c.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in c.fetchall()]
-            
-            required_tables = ['health_logs', 'user_settings', 'user_points', 'detailed_logs']
-            missing_tables = [table for table in required_tables if table not in tables]
-            
-            if missing_tables:
-                print(f"❌ Missing tables: {missing_tables}")
-                return False
-            else:
-                print("✅ All required tables created successfully")
-                
-            # Check detailed_logs schema
-            c.execute("PRAGMA table_info(detailed_logs)")
-            columns = {row[1] for row in c.fetchall()}
-            required_columns = {
-                'id', 'timestamp', 'action', 'posture_status', 'back_angle',
-                'water_intake', 'break_taken', 'activity', 'forward_lean',
-                'shoulder_alignment', 'session_status', 'game'
-            }
+        # Shared run-wide connection from _db; not closed here, later tests reuse it
+        c = get_conn().cursor()
+        
+        # Check if tables exist
+        c.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = [row[0] for row in c.fetchall()]
+        
+        required_tables = ['health_logs', 'user_settings', 'user_points', 'detailed_logs']
+        missing_tables = [table for table in required_tables if table not in tables]
+        
+        if missing_tables:
+            print(f"❌ Missing tables: {missing_tables}")
+            return False
+        else:
+            print("✅ All required tables created successfully")
             
-            missing_columns = required_columns - columns
-            if missing_columns:
-                print(f"❌ Missing columns in detailed_logs: {missing_columns}")
-                return False
-            else:
-                print("✅ All required columns present in detailed_logs")
-                
-            return True
+        # setup_database switches the file to WAL (in-memory databases report "memory")
+        c.execute("PRAGMA journal_mode")
+        journal_mode = c.fetchone()[0]
+        if journal_mode not in ('wal', 'memory'):
+            print(f"❌ Expected WAL journal mode, got {journal_mode}")
+            return False
+        print("✅ Database is in WAL mode")
+
+        # Check detailed_logs schema; an empty SELECT fills cursor.description with no row fetch
+        c.execute("SELECT * FROM detailed_logs LIMIT 0")
+        columns = {d[0] for d in c.description}
+        required_columns = {
+            'id', 'timestamp', 'good_posture', 'forward_lean_flag', 'uneven_shoulders_flag',
+            'back_angle', 'forward_lean', 'shoulder_alignment', 'session_status', 'game'
+        }
+        
+        missing_columns = required_columns - columns
+        if missing_columns:
+            print(f"❌ Missing columns in detailed_logs: {missing_columns}")
+            return False
+        else:
+            print("✅ All required columns present in detailed_logs")
             
+        return True
+        
     except Exception as e:
         print(f"❌ Database setup test failed: {e}")
         return False
 
+@script_test
+def test_in_memory_setup():
+    """Test that an in-memory HT_DB_PATH database keeps the tables setup_database creates"""
+    print("\nTesting in-memory database setup...")
+
+    uri = "file:ht_setup_test?mode=memory&cache=shared"
+    saved = main3.DB_PATH, main3._log_conn
+    main3.DB_PATH, main3._log_conn = uri, None
+    try:
+        setup_database()
+        # A fresh connection only sees the schema while setup_database's connection is open
+        with contextlib.closing(sqlite3.connect(uri, uri=True)) as conn:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        missing_tables = {'health_logs', 'user_settings', 'user_points', 'detailed_logs'} - tables
+        if missing_tables:
+            print(f"❌ Missing tables in in-memory database: {missing_tables}")
+            return False
+        print("✅ In-memory database keeps its tables")
+        return True
+    finally:
+        main3.close_log_connection()
+        main3.DB_PATH, main3._log_conn = saved
+
+@script_test
 def test_logging_functions():
     """Test the logging functions with various data types"""
     print("\nTesting logging functions...")
     
     try:
-        # Test 1: Basic action logging
-        print("Testing basic action logging...")
-        log_action("Test action", session_status="Testing")
-        
-        # Test 2: Aggregated posture data logging (30-second mode)
-        print("Testing aggregated posture data logging...")
-        log_posture_data(
-            feedback="Good posture",  # This would be the mode over 30 seconds
-            back_angle=175.5,
-            forward_lean=0.02,
-            shoulder_diff=0.01,
-            game_name="test_game.exe"
-        )
-        
-        # Test 3: Hydration reminder logging
-        print("Testing hydration reminder logging...")
-        log_action("Hydration reminder sent", water_intake=1, game="test_game.exe")
-        
-        # Test 4: Break reminder logging
-        print("Testing break reminder logging...")
-        log_action("Break reminder sent", break_taken=1, game="test_game.exe")
-        
-        # Test 5: Session logging
-        print("Testing session logging...")
-        log_action("Session started", session_status="Started", game="test_game.exe")
-        
-        # Test 6: Invalid data handling
-        print("Testing invalid data handling...")
-        log_action("Test with invalid data", back_angle="invalid", forward_lean=-5)
-        
+        # All six rows are committed together when the block exits
+        with logging_transaction():
+            # Tests 1, 3-6: basic, hydration/break reminder, session and invalid-data rows,
+            # submitted with one executemany
+            print("Testing action logging (basic, reminders, session, invalid data)...")
+            log_actions([
+                dict(session_status="Testing"),
+                dict(good_posture=1, session_status="Running", game="test_game.exe"),
+                dict(good_posture=0, session_status="Running", game="test_game.exe"),
+                dict(session_status="Started", game="test_game.exe"),
+                dict(back_angle="invalid", forward_lean=-5),
+            ])
+
+            # Test 2: Aggregated posture data logging (30-second mode)
+            print("Testing aggregated posture data logging...")
+            log_posture_data(
+                feedback="Good posture",  # This would be the mode over 30 seconds
+                back_angle=175.5,
+                forward_lean=0.02,
+                shoulder_diff=0.01,
+                game_name="test_game.exe"
+            )
+
         print("✅ All logging tests completed")
         return True
         
@@ -104,49 +134,37 @@ def test_logging_functions():
         print(f"❌ Logging test failed: {e}")
         return False
 
+@script_test
 def verify_logged_data():
     """Verify that the logged data is correct and consistent"""
     print("\nVerifying logged data...")
     
     try:
-        with sqlite3.connect("health_tracker.db") as conn:
-            c = conn.cursor()
-            
-            # Get all logged data
-            c.execute("SELECT * FROM detailed_logs ORDER BY timestamp DESC LIMIT 10")
-            rows = c.fetchall()
-            
-            if not rows:
-                print("❌ No data found in database")
-                return False
-            
-            print(f"✅ Found {len(rows)} log entries")
-            
-            # Check data consistency
-            for i, row in enumerate(rows):
-                print(f"\nEntry {i+1}:")
-                print(f"  Timestamp: {row[1]}")
-                print(f"  Action: {row[2]}")
-                print(f"  Posture Status: {row[3]}")
-                print(f"  Back Angle: {row[4]}")
-                print(f"  Water Intake: {row[5]}")
-                print(f"  Break Taken: {row[6]}")
-                print(f"  Forward Lean: {row[8]}")
-                print(f"  Shoulder Alignment: {row[9]}")
-                print(f"  Session Status: {row[10]}")
-                print(f"  Game: {row[11]}")
-            
-            # Check for data validation
-            c.execute("SELECT COUNT(*) FROM detailed_logs WHERE back_angle < 0 OR back_angle > 360")
-            invalid_angles = c.fetchone()[0]
-            
-            if invalid_angles > 0:
-                print(f"⚠️  Found {invalid_angles} entries with invalid back angles")
-            else:
-                print("✅ All back angles are within valid range")
-            
-            return True
-            
+        # Shared run-wide connection from _db; not closed here, later tests reuse it
+        c = get_conn().cursor()
+        
+        # Get all logged data
+        c.execute("SELECT * FROM detailed_logs ORDER BY timestamp DESC LIMIT 10")
+        df = pd.DataFrame(c.fetchall(), columns=[d[0] for d in c.description])
+        
+        if df.empty:
+            print("❌ No data found in database")
+            return False
+        
+        print(f"✅ Found {len(df)} log entries")
+        print(df.drop(columns="id").to_string(index=False))
+        
+        # Check for data validation (non-numeric angles such as "invalid" count as out of range)
+        angles = pd.to_numeric(df["back_angle"], errors="coerce")
+        invalid_angles = int(((angles < 0) | (angles > 360) | (angles.isna() & df["back_angle"].notna())).sum())
+        
+        if invalid_angles > 0:
+            print(f"⚠️  Found {invalid_angles} entries with invalid back angles")
+        else:
+            print("✅ All back angles are within valid range")
+        
+        return True
+        
     except Exception as e:
         print(f"❌ Data verification failed: {e}")
         return False
@@ -159,6 +177,7 @@ def main():
     # Run tests
     tests = [
         ("Database Setup", test_database_setup),
+        ("In-Memory Setup", test_in_memory_setup),
         ("Logging Functions", test_logging_functions),
         ("Data Verification", verify_logged_data)
     ]
@@ -168,10 +187,11 @@ def main():
     
     for test_name, test_func in tests:
         print(f"\n🔍 Running {test_name} test...")
-        if test_func():
+        try:
+            test_func()
             passed += 1
             print(f"✅ {test_name} test PASSED")
-        else:
+        except AssertionError:
             print(f"❌ {test_name} test FAILED")
     
     print("\n" + "=" * 50)